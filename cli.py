@@ -14,21 +14,119 @@ Usage:
 
 import argparse
 import sys
+import time
 import csv
 import json
 import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from itertools import chain
 from datetime import datetime
-from enrichment_engine import CustomEnrichmentEngine
-from presets.load_preset import PresetLoader, apply_preset
+from enrichment_cache import EnrichmentCache
 import config
 
+try:
+    import orjson
+except ImportError:  # Optional - falls back to the stdlib encoder
+    orjson = None
+
+
+# Column order for batch CSV and Parquet output
+BATCH_OUTPUT_FIELDS = (
+    'Company', 'Domain', 'Score', 'Intent', 'Recommendation', 'Enrichment Date'
+)
+
+
+class ProgressLine:
+    """
+    Throttled single-line progress display for batch runs
+
+    Redraws at most ~10 times per second on a terminal (every few seconds
+    when output is redirected to a log), so per-lead progress costs no
+    terminal writes on fast runs. Written to stderr like other progress
+    meters, keeping stdout for results.
+    """
+
+    def __init__(self, desc, stream=sys.stderr):
+        self.desc = desc
+        self.stream = stream
+        self.is_tty = stream.isatty()
+        self.interval = 0.1 if self.is_tty else 5.0
+        self.count = 0
+        self.status = ''
+        self._last_draw = 0.0
+
+    def update(self, status=''):
+        """Record one completed lead and redraw if the interval has passed"""
+        self.count += 1
+        self.status = status
+        now = time.monotonic()
+        if now - self._last_draw >= self.interval:
+            self._draw()
+            self._last_draw = now
+
+    def write(self, message):
+        """Print a full line (e.g. an alert) to stdout without garbling the progress line"""
+        if self.is_tty:
+            self.stream.write('\r\033[K')
+            self.stream.flush()
+        print(message)
+
+    def close(self):
+        """Draw the final state and move to a new line"""
+        self._draw()
+        if self.is_tty:
+            self.stream.write('\n')
+        self.stream.flush()
+
+    def _draw(self):
+        line = f"{self.desc}: {self.count} leads"
+        if self.status:
+            line += f" [last: {self.status}]"
+        if self.is_tty:
+            self.stream.write(f"\r\033[K{line}")
+        else:
+            self.stream.write(f"{line}\n")
+        self.stream.flush()
+
 
 class EnrichmentCLI:
     """Command-line interface for lead enrichment"""
 
     def __init__(self):
-        self.engine = CustomEnrichmentEngine()
-        self.preset_loader = PresetLoader()
+        self.cache = EnrichmentCache()
+        self.rebuild = False
+
+    # The engine and preset loader are imported and built on first use so
+    # --help, argument errors and preset commands skip loading the HTTP stack
+
+    @cached_property
+    def engine(self):
+        """Enrichment engine, created the first time a command needs it"""
+        from enrichment_engine import CustomEnrichmentEngine
+        from serp_client import SerpClient
+        from signal_tracker import SignalTracker
+
+        # Raw SERP responses are also kept on disk (for SERP_CACHE_TTL), so
+        # queries shared with a recent run skip the API even when the lead's
+        # signal config changed. --rebuild neither reads nor refreshes them.
+        serp_cache = None
+        if self.cache is not None and not self.rebuild:
+            serp_cache = EnrichmentCache(
+                os.path.join(self.cache.cache_dir, 'serp'), ttl=config.SERP_CACHE_TTL
+            )
+        tracker = SignalTracker(serp_client=SerpClient(disk_cache=serp_cache))
+
+        # The memo answers leads repeated within one input file from memory
+        memo_size = 4096 if self.cache is not None else 0
+        return CustomEnrichmentEngine(signal_tracker=tracker, cache=self.cache, memo_size=memo_size)
+
+    @cached_property
+    def preset_loader(self):
+        """Preset loader, created the first time a command needs it"""
+        from presets.load_preset import PresetLoader
+        return PresetLoader()
 
     def enrich_command(self, args):
         """
@@ -39,9 +137,13 @@ class EnrichmentCLI:
             python cli.py enrich --domain stripe.com --company Stripe
             python cli.py enrich --domain stripe.com --output json
             python cli.py enrich --domain stripe.com --preset fintech
+            python cli.py enrich --domain stripe.com --no-cache
         """
+        self._configure_cache(args)
+
         # Load preset if specified
         if args.preset:
+            from presets.load_preset import apply_preset
             try:
                 apply_preset(args.preset)
                 if args.output != 'json':
@@ -53,8 +155,7 @@ class EnrichmentCLI:
         # Enrich the lead
         try:
             result = self.engine.enrich_with_custom_signals(
-                domain=args.domain,
-                company_name=args.company
+                args.domain, args.company, refresh=self.rebuild
             )
 
             # Output based on format
@@ -78,8 +179,12 @@ class EnrichmentCLI:
         Examples:
             python cli.py batch --input leads.csv
             python cli.py batch --input leads.csv --output-file enriched.json --format json
+            python cli.py batch --input leads.csv --format parquet
             python cli.py batch --input leads.csv --preset devtools
+            python cli.py batch --input leads.csv --workers 16
         """
+        self._configure_cache(args)
+
         # Validate input file
         if not os.path.exists(args.input):
             print(f"Error: Input file '{args.input}' not found", file=sys.stderr)
@@ -87,6 +192,7 @@ class EnrichmentCLI:
 
         # Load preset if specified
         if args.preset:
+            from presets.load_preset import apply_preset
             try:
                 apply_preset(args.preset)
                 print(f"✓ Using preset: {args.preset}")
@@ -94,56 +200,69 @@ class EnrichmentCLI:
                 print(f"Error loading preset '{args.preset}': {e}", file=sys.stderr)
                 sys.exit(1)
 
-        # Read leads from CSV
-        leads = []
+        # Stream leads from CSV - only the first row is read up front
         try:
-            with open(args.input, 'r') as f:
-                reader = csv.DictReader(f)
-                leads = list(reader)
+            leads = self._stream_leads(args.input)
+            first_lead = next(leads, None)
 
-            if not leads:
+            if first_lead is None:
                 print(f"Error: No leads found in {args.input}", file=sys.stderr)
                 sys.exit(1)
 
-            # Validate required columns
-            if 'domain' not in leads[0]:
-                print("Error: CSV must have 'domain' column", file=sys.stderr)
-                sys.exit(1)
+        except ValueError as e:
+            # Missing required columns
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
 
         except Exception as e:
             print(f"Error reading {args.input}: {e}", file=sys.stderr)
             sys.exit(1)
 
         # Enrich all leads
-        print(f"\nEnriching {len(leads)} leads...")
+        print(f"\nEnriching leads from {args.input} (streaming)...")
         print("-" * 60)
 
-        enriched_results = []
-        for i, lead in enumerate(leads, 1):
-            domain = lead['domain']
-            company_name = lead.get('company_name', lead.get('name'))
+        # Results arrive in completion order; each is kept under its input
+        # row index so the saved file lists leads in input order
+        results_by_index = {}
+        scores = []  # Collected alongside results so the summary needs no dict lookups
+        progress = ProgressLine('Enriching')
+        completed = self.engine.enrich_batch(
+            chain([first_lead], leads), max_workers=args.workers, refresh=self.rebuild
+        )
+        # Later rows are only read as workers free up, so a malformed row can
+        # surface mid-run; leads enriched before it are still saved below
+        read_error = None
+        try:
+            for index, domain, result, error in completed:
+                if error is None:
+                    results_by_index[index] = result
+
+                    # Quick status
+                    score = result['custom_signals']['total_score']
+                    intent = result['custom_signals']['intent_level']
+                    scores.append(score)
+                    progress.update(f"{domain} {score}/100 ({intent})")
 
-            print(f"[{i}/{len(leads)}] {domain}...", end=' ', flush=True)
+                else:
+                    progress.write(f"{domain}... Error: {error}")
+                    progress.update(f"{domain} error")
+                    # Add error result
+                    results_by_index[index] = {
+                        'domain': domain,
+                        'error': str(error)
+                    }
 
-            try:
-                result = self.engine.enrich_with_custom_signals(
-                    domain=domain,
-                    company_name=company_name
-                )
-                enriched_results.append(result)
+        except (OSError, csv.Error, ValueError) as e:
+            read_error = e
 
-                # Quick status
-                score = result['custom_signals']['total_score']
-                intent = result['custom_signals']['intent_level']
-                print(f"{score}/100 ({intent})")
+        progress.close()
+        enriched_results = [results_by_index[index] for index in sorted(results_by_index)]
 
-            except Exception as e:
-                print(f"Error: {e}")
-                # Add error result
-                enriched_results.append({
-                    'domain': domain,
-                    'error': str(e)
-                })
+        if read_error is not None:
+            print(f"Error reading {args.input}: {read_error}", file=sys.stderr)
+            print(f"Saving the {len(enriched_results)} leads enriched before the error",
+                  file=sys.stderr)
 
         # Output results
         print("\n" + "-" * 60)
@@ -154,8 +273,9 @@ class EnrichmentCLI:
 
         try:
             if args.format == 'json':
-                with open(output_file, 'w') as f:
-                    json.dump(enriched_results, f, indent=2)
+                self._save_json(enriched_results, output_file)
+            elif args.format == 'parquet':
+                self._save_batch_parquet(enriched_results, output_file)
             else:  # csv
                 self._save_batch_csv(enriched_results, output_file)
 
@@ -166,7 +286,10 @@ class EnrichmentCLI:
             sys.exit(1)
 
         # Print summary
-        self._print_batch_summary(enriched_results)
+        self._print_batch_summary(len(enriched_results), scores)
+
+        if read_error is not None:
+            sys.exit(1)
 
     def monitor_command(self, args):
         """
@@ -179,52 +302,58 @@ class EnrichmentCLI:
             python cli.py monitor --leads-file leads.csv
             python cli.py monitor --leads-file leads.csv --alert-threshold 70
         """
+        self._configure_cache(args)
+
         # Validate input file
         if not os.path.exists(args.leads_file):
             print(f"Error: Leads file '{args.leads_file}' not found", file=sys.stderr)
             sys.exit(1)
 
-        # Read leads
-        try:
-            with open(args.leads_file, 'r') as f:
-                reader = csv.DictReader(f)
-                leads = list(reader)
-        except Exception as e:
-            print(f"Error reading leads file: {e}", file=sys.stderr)
-            sys.exit(1)
-
         # Enrich and check for alerts
         print(f"\n{'='*60}")
         print(f"MONITORING RUN: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"{'='*60}")
-        print(f"Monitoring {len(leads)} leads (threshold: {args.alert_threshold})")
+        print(f"Monitoring leads from {args.leads_file} (threshold: {args.alert_threshold})")
         print(f"Schedule: {args.schedule}")
         print("-" * 60)
 
         alerts = []
-        for lead in leads:
-            domain = lead['domain']
-            company_name = lead.get('company_name', lead.get('name'))
+        progress = ProgressLine('Monitoring')
+        try:
+            completed = self.engine.enrich_batch(
+                self._stream_leads(args.leads_file),
+                max_workers=args.workers,
+                refresh=self.rebuild
+            )
+            for index, domain, result, error in completed:
+                if error is not None:
+                    progress.write(f"   Error monitoring {domain}: {error}")
+                    progress.update(f"{domain} error")
+                    continue
 
-            try:
-                result = self.engine.enrich_with_custom_signals(domain, company_name)
                 score = result['custom_signals']['total_score']
 
                 # Check if alert threshold exceeded
                 if score >= args.alert_threshold:
-                    alerts.append({
+                    alerts.append((index, {
                         'domain': domain,
                         'company_name': result['company_name'],
                         'score': score,
                         'intent': result['custom_signals']['intent_level'],
                         'recommendation': result['custom_signals']['recommendation']
-                    })
-                    print(f"🔔 ALERT: {domain} - Score {score}/100")
-                else:
-                    print(f"   {domain} - Score {score}/100")
+                    }))
+                    progress.write(f"🔔 ALERT: {domain} - Score {score}/100")
 
-            except Exception as e:
-                print(f"   Error monitoring {domain}: {e}")
+                progress.update(f"{domain} {score}/100")
+
+        except (OSError, csv.Error, ValueError) as e:
+            print(f"Error reading leads file: {e}", file=sys.stderr)
+            sys.exit(1)
+
+        progress.close()
+
+        # Report and save alerts in leads-file order, not completion order
+        alerts = [alert for _, alert in sorted(alerts, key=lambda item: item[0])]
 
         # Output alerts
         print("\n" + "=" * 60)
@@ -239,8 +368,7 @@ class EnrichmentCLI:
 
             # Save alerts to file
             alert_file = f"alerts_{datetime.now().strftime('%Y%m%d')}.json"
-            with open(alert_file, 'w') as f:
-                json.dump(alerts, f, indent=2)
+            self._save_json(alerts, alert_file)
             print(f"\n✓ Alerts saved to: {alert_file}")
 
         else:
@@ -266,9 +394,17 @@ class EnrichmentCLI:
             print("AVAILABLE INDUSTRY PRESETS")
             print("=" * 60)
 
-            for preset_name in presets:
+            # Load preset files concurrently so disk reads overlap, then
+            # print in sorted order
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                futures = [
+                    pool.submit(self.preset_loader.get_preset_info, preset_name)
+                    for preset_name in presets
+                ]
+
+            for preset_name, future in zip(presets, futures):
                 try:
-                    info = self.preset_loader.get_preset_info(preset_name)
+                    info = future.result()
                     print(f"\n{preset_name}")
                     print(f"  Industry: {info['industry']}")
                     print(f"  Signals: {info['signal_count']}")
@@ -310,6 +446,7 @@ class EnrichmentCLI:
 
         elif args.use:
             # Apply preset
+            from presets.load_preset import apply_preset
             try:
                 preset = apply_preset(args.use)
                 print(f"\n✓ Applied preset: {preset['industry']}")
@@ -324,6 +461,62 @@ class EnrichmentCLI:
             print("Error: Use --list, --show <name>, or --use <name>", file=sys.stderr)
             sys.exit(1)
 
+    def _configure_cache(self, args):
+        """
+        Apply --no-cache and --rebuild before the engine is created
+
+        --no-cache bypasses the cache entirely, while --rebuild queries the
+        SERP API for every lead and overwrites the cached results.
+        """
+        if args.no_cache:
+            self.cache = None
+        self.rebuild = args.rebuild
+
+    def _stream_leads(self, filename):
+        """
+        Yield (domain, company_name) pairs from a CSV file one at a time
+
+        Rows are parsed lazily so enrichment can start before the whole
+        file has been read, and memory stays flat for large lead lists.
+        Only the two needed fields are pulled out of each row, by column
+        position, so no per-row dict is built.
+
+        Args:
+            filename (str): Path to CSV file with a 'domain' column and an
+                            optional 'company_name' (or 'name') column
+
+        Yields:
+            tuple: (domain, company_name) - company_name is None if absent
+
+        Raises:
+            ValueError: If the CSV has no 'domain' column
+        """
+        with open(filename, 'r') as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return
+
+            if 'domain' not in header:
+                raise ValueError("CSV must have 'domain' column")
+            domain_col = header.index('domain')
+
+            if 'company_name' in header:
+                name_col = header.index('company_name')
+            elif 'name' in header:
+                name_col = header.index('name')
+            else:
+                name_col = None
+
+            for row in reader:
+                if not row:
+                    continue  # Skip blank lines
+                domain = row[domain_col] if domain_col < len(row) else None
+                if name_col is not None and name_col < len(row):
+                    yield domain, row[name_col]
+                else:
+                    yield domain, None
+
     def _output_text(self, result):
         """Output enrichment result in text format"""
         print("\n" + "=" * 60)
@@ -377,65 +570,187 @@ class EnrichmentCLI:
             result['custom_signals']['recommendation']
         ])
 
+    def _save_json(self, data, filename):
+        """Save data as indented JSON, using orjson when it is installed"""
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(data, f, indent=2)
+
     def _save_batch_csv(self, results, filename):
         """Save batch results to CSV file"""
         with open(filename, 'w', newline='') as f:
             writer = csv.writer(f)
 
             # Header
-            writer.writerow([
-                'Company', 'Domain', 'Score', 'Intent',
-                'Recommendation', 'Enrichment Date'
-            ])
-
-            # Data rows
-            for result in results:
-                if 'error' in result:
-                    # Error row
-                    writer.writerow([
-                        result.get('company_name', ''),
-                        result['domain'],
-                        'ERROR',
-                        '',
-                        result['error'],
-                        datetime.now().isoformat()
-                    ])
-                else:
-                    writer.writerow([
-                        result['company_name'],
-                        result['domain'],
-                        result['custom_signals']['total_score'],
-                        result['custom_signals']['intent_level'],
-                        result['custom_signals']['recommendation'],
-                        result['enrichment_date']
-                    ])
-
-    def _print_batch_summary(self, results):
-        """Print summary statistics for batch enrichment"""
-        # Count by intent level
-        high = sum(1 for r in results if r.get('custom_signals', {}).get('intent_level') == 'High')
-        medium = sum(1 for r in results if r.get('custom_signals', {}).get('intent_level') == 'Medium')
-        low = sum(1 for r in results if r.get('custom_signals', {}).get('intent_level') == 'Low')
-        errors = sum(1 for r in results if 'error' in r)
+            writer.writerow(BATCH_OUTPUT_FIELDS)
+
+            # Data rows - built by one generator and written in a single
+            # writerows() call so the per-row loop runs inside the csv module
+            writer.writerows(self._batch_csv_rows(results))
+
+    def _batch_csv_rows(self, results):
+        """Yield one CSV row per batch result"""
+        # Errored leads have no enrichment date - stamp them all with the save time
+        now_iso = datetime.now().isoformat()
+
+        for result in results:
+            if 'error' in result:
+                # Error row
+                yield (
+                    result.get('company_name', ''),
+                    result['domain'],
+                    'ERROR',
+                    '',
+                    result['error'],
+                    now_iso
+                )
+            else:
+                signals = result['custom_signals']
+                yield (
+                    result['company_name'],
+                    result['domain'],
+                    signals['total_score'],
+                    signals['intent_level'],
+                    signals['recommendation'],
+                    result['enrichment_date']
+                )
+
+    def _save_batch_parquet(self, results, filename):
+        """
+        Save batch results to a Parquet file
+
+        Uses the same columns as the CSV output, but typed: Score is an
+        integer column (null for errors) and errored leads carry 'ERROR'
+        in the Intent column with the message as the Recommendation.
+        Requires pyarrow.
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise RuntimeError("Parquet output requires pyarrow (pip install pyarrow)")
+
+        columns = {field: [] for field in BATCH_OUTPUT_FIELDS}
+        now_iso = datetime.now().isoformat()
+
+        for result in results:
+            columns['Domain'].append(result['domain'])
+            if 'error' in result:
+                columns['Company'].append(result.get('company_name', ''))
+                columns['Score'].append(None)
+                columns['Intent'].append('ERROR')
+                columns['Recommendation'].append(result['error'])
+                columns['Enrichment Date'].append(now_iso)
+            else:
+                signals = result['custom_signals']
+                columns['Company'].append(result['company_name'])
+                columns['Score'].append(signals['total_score'])
+                columns['Intent'].append(signals['intent_level'])
+                columns['Recommendation'].append(signals['recommendation'])
+                columns['Enrichment Date'].append(result['enrichment_date'])
+
+        table = pa.table({
+            **columns,
+            'Score': pa.array(columns['Score'], type=pa.int32())
+        })
+
+        # Dictionary encoding shrinks the highly repetitive Intent and
+        # Recommendation columns
+        pq.write_table(table, filename, compression='zstd', use_dictionary=True)
+
+    def _print_batch_summary(self, total_leads, scores):
+        """
+        Print summary statistics for batch enrichment
+
+        Args:
+            total_leads (int): Number of leads processed, including errors
+            scores (list): Signal scores of the successfully enriched leads
+        """
+        errors = total_leads - len(scores)
+
+        # Tally scores with Counter (counted in C), then bucket the few
+        # distinct score values against the intent thresholds
+        intent_counts = Counter()
+        total_score = 0
+        for score, count in Counter(scores).items():
+            if score >= config.INTENT_THRESHOLDS['high']:
+                intent_counts['High'] += count
+            elif score >= config.INTENT_THRESHOLDS['medium']:
+                intent_counts['Medium'] += count
+            else:
+                intent_counts['Low'] += count
+            total_score += score * count
 
         # Calculate average score
-        scores = [r['custom_signals']['total_score'] for r in results if 'custom_signals' in r]
-        avg_score = sum(scores) / len(scores) if scores else 0
+        avg_score = total_score / len(scores) if scores else 0
 
         print("\n" + "=" * 60)
         print("BATCH SUMMARY")
         print("=" * 60)
-        print(f"Total Leads: {len(results)}")
-        print(f"  High Intent: {high}")
-        print(f"  Medium Intent: {medium}")
-        print(f"  Low Intent: {low}")
+        print(f"Total Leads: {total_leads}")
+        print(f"  High Intent: {intent_counts['High']}")
+        print(f"  Medium Intent: {intent_counts['Medium']}")
+        print(f"  Low Intent: {intent_counts['Low']}")
         if errors:
             print(f"  Errors: {errors}")
         print(f"\nAverage Score: {avg_score:.1f}/100")
 
 
-def main():
-    """Main CLI entry point"""
+def _parse_enrich_fast(argv):
+    """
+    Parse a plain `enrich` invocation without building the argparse parser
+
+    Single-lead enrichment is often called once per lead from shell
+    scripts, so the common case skips constructing the full parser with
+    all its subcommands. Anything unusual (help, unknown flags, missing
+    values, invalid choices) returns None so argparse handles it and
+    reports errors as usual.
+
+    Args:
+        argv (list): Command-line arguments, excluding the program name
+
+    Returns:
+        argparse.Namespace or None: Parsed arguments, or None to fall back
+    """
+    if not argv or argv[0] != 'enrich':
+        return None
+
+    args = argparse.Namespace(
+        command='enrich', domain=None, company=None, output='text',
+        preset=None, no_cache=False, rebuild=False
+    )
+    value_options = {
+        '--domain': 'domain',
+        '--company': 'company',
+        '--output': 'output',
+        '--preset': 'preset'
+    }
+
+    tokens = iter(argv[1:])
+    for token in tokens:
+        if token == '--no-cache':
+            args.no_cache = True
+        elif token == '--rebuild':
+            args.rebuild = True
+        elif token in value_options:
+            value = next(tokens, None)
+            if value is None or value.startswith('-'):
+                return None
+            setattr(args, value_options[token], value)
+        else:
+            return None
+
+    if args.domain is None or args.output not in ('text', 'json', 'csv'):
+        return None
+
+    return args
+
+
+def _build_parser():
+    """Build the full argparse parser for all subcommands"""
     parser = argparse.ArgumentParser(
         description='Lead Enrichment Engine CLI',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -475,14 +790,24 @@ For more information, see README.md
     enrich_parser.add_argument('--output', choices=['text', 'json', 'csv'], default='text',
                               help='Output format (default: text)')
     enrich_parser.add_argument('--preset', help='Industry preset to use (e.g., devtools, fintech)')
+    enrich_parser.add_argument('--no-cache', action='store_true',
+                              help="Bypass the result cache entirely")
+    enrich_parser.add_argument('--rebuild', action='store_true',
+                              help='Query the SERP API and overwrite cached results')
 
     # Batch command
     batch_parser = subparsers.add_parser('batch', help='Batch process leads from CSV')
     batch_parser.add_argument('--input', required=True, help='Input CSV file with domains')
     batch_parser.add_argument('--output-file', help='Output filename (auto-generated if not provided)')
-    batch_parser.add_argument('--format', choices=['json', 'csv'], default='csv',
+    batch_parser.add_argument('--format', choices=['json', 'csv', 'parquet'], default='csv',
                             help='Output format (default: csv)')
     batch_parser.add_argument('--preset', help='Industry preset to use')
+    batch_parser.add_argument('--workers', type=int, default=8,
+                            help='Number of leads to enrich concurrently (default: 8)')
+    batch_parser.add_argument('--no-cache', action='store_true',
+                            help="Bypass the result cache entirely")
+    batch_parser.add_argument('--rebuild', action='store_true',
+                            help='Query the SERP API and overwrite cached results')
 
     # Monitor command
     monitor_parser = subparsers.add_parser('monitor', help='Monitor leads on schedule')
@@ -491,6 +816,12 @@ For more information, see README.md
                                help='Monitoring schedule (default: weekly)')
     monitor_parser.add_argument('--alert-threshold', type=int, default=60,
                                help='Signal score threshold for alerts (default: 60)')
+    monitor_parser.add_argument('--workers', type=int, default=8,
+                               help='Number of leads to enrich concurrently (default: 8)')
+    monitor_parser.add_argument('--no-cache', action='store_true',
+                               help="Bypass the result cache entirely")
+    monitor_parser.add_argument('--rebuild', action='store_true',
+                               help='Query the SERP API and overwrite cached results')
 
     # Preset command
     preset_parser = subparsers.add_parser('preset', help='Manage industry presets')
@@ -499,13 +830,21 @@ For more information, see README.md
     preset_group.add_argument('--show', metavar='NAME', help='Show preset details')
     preset_group.add_argument('--use', metavar='NAME', help='Apply preset')
 
-    # Parse arguments
-    args = parser.parse_args()
+    return parser
 
-    # Show help if no command provided
-    if not args.command:
-        parser.print_help()
-        sys.exit(1)
+
+def main():
+    """Main CLI entry point"""
+    # Parse arguments - plain `enrich` calls skip building the full parser
+    args = _parse_enrich_fast(sys.argv[1:])
+    if args is None:
+        parser = _build_parser()
+        args = parser.parse_args()
+
+        # Show help if no command provided
+        if not args.command:
+            parser.print_help()
+            sys.exit(1)
 
     # Validate config before running
     try:
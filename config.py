@@ -4,6 +4,8 @@ Manages API credentials, signal definitions, and scoring thresholds
 """
 
 import os
+from itertools import compress
+from types import MappingProxyType
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -15,6 +17,56 @@ SERP_ZONE = os.getenv('SERP_ZONE')
 DEFAULT_COUNTRY = os.getenv('DEFAULT_COUNTRY', 'us')
 DEFAULT_LANGUAGE = os.getenv('DEFAULT_LANGUAGE', 'en')
 
+# Maximum number of SERP API requests in flight at once, shared by all
+# concurrently enriched leads
+MAX_CONCURRENT_SERP = int(os.getenv('MAX_CONCURRENT_SERP', '32'))
+
+# In-memory cache of raw SERP responses, keyed on (query, country, language)
+# Set SERP_CACHE_SIZE=0 to disable
+SERP_CACHE_SIZE = int(os.getenv('SERP_CACHE_SIZE', '512'))
+SERP_CACHE_TTL = int(os.getenv('SERP_CACHE_TTL', '1800'))  # Seconds (default: 30 minutes)
+
+# Enrichment result cache
+# Results are reused for the same domain and signal config within a day
+CACHE_DIR = os.path.expanduser(os.getenv('CACHE_DIR', '~/.cache/lead_enrichment'))
+CACHE_TTL = int(os.getenv('CACHE_TTL', '86400'))  # Seconds (default: 1 day)
+
+
+def freeze_signals(signals):
+    """
+    Return a read-only copy of a signal configuration
+
+    Keywords become tuples and are lowercased once (as keywords_lower) for
+    case-insensitive matching, and disabled signals are dropped. The
+    example configs freeze their CUSTOM_SIGNALS with this so the
+    definitions can't be changed by accident at runtime; re-enable a
+    signal by editing the config. Defined above CUSTOM_SIGNALS so a
+    config imported from here can use it.
+
+    Args:
+        signals (dict): Signal name -> definition, as in CUSTOM_SIGNALS
+
+    Returns:
+        MappingProxyType: Enabled signals, each a read-only mapping
+
+    Example:
+        CUSTOM_SIGNALS = freeze_signals(CUSTOM_SIGNALS)
+    """
+    frozen = {}
+    for name, signal in signals.items():
+        if not signal.get('enabled', False):
+            continue
+
+        keywords = tuple(signal['keywords'])
+        frozen[name] = MappingProxyType(dict(
+            signal,
+            keywords=keywords,
+            keywords_lower=tuple(keyword.lower() for keyword in keywords)
+        ))
+
+    return MappingProxyType(frozen)
+
+
 # Custom buying signals configuration
 # Each signal tracks specific indicators that suggest a company is ready to buy
 CUSTOM_SIGNALS = {
@@ -63,6 +115,28 @@ CUSTOM_SIGNALS = {
     }
 }
 
+# Flat, immutable views of CUSTOM_SIGNALS (one entry per signal, same order)
+# Hot paths index these tuples instead of walking the nested dicts
+def refresh_signal_tables():
+    """
+    Rebuild the SIGNAL_* tables from CUSTOM_SIGNALS
+
+    Runs at import time; call again after replacing CUSTOM_SIGNALS
+    (e.g. when applying a preset).
+    """
+    global SIGNAL_NAMES, SIGNAL_WEIGHTS, SIGNAL_ENABLED, SIGNAL_KEYWORDS, ENABLED_WEIGHT_TOTAL
+
+    SIGNAL_NAMES = tuple(CUSTOM_SIGNALS)
+    SIGNAL_WEIGHTS = tuple(signal['weight'] for signal in CUSTOM_SIGNALS.values())
+    SIGNAL_ENABLED = tuple(signal.get('enabled', False) for signal in CUSTOM_SIGNALS.values())
+    SIGNAL_KEYWORDS = tuple(tuple(signal['keywords']) for signal in CUSTOM_SIGNALS.values())
+
+    # Computed once here rather than on every validate_config() call
+    ENABLED_WEIGHT_TOTAL = sum(compress(SIGNAL_WEIGHTS, SIGNAL_ENABLED))
+
+
+refresh_signal_tables()
+
 # Intent scoring thresholds
 # Determines how we classify leads based on their total signal score
 INTENT_THRESHOLDS = {
@@ -71,6 +145,20 @@ INTENT_THRESHOLDS = {
     'low': 0       # Score < 30: Low intent, nurture or disqualify
 }
 
+# Skip the remaining (lower-weight) signals once the intent level can no
+# longer change. Saves SERP queries, but reported scores and evidence only
+# cover the signals that were checked.
+EARLY_STOP_SIGNALS = os.getenv('EARLY_STOP_SIGNALS', 'false').lower() == 'true'
+
+# Search each signal with one combined query ("a" OR "b" OR ...) instead of
+# one query per keyword. Far fewer SERP calls, but each keyword competes for
+# the same 10 results, so rarer keywords may go unmatched.
+COMBINE_SIGNAL_KEYWORDS = os.getenv('COMBINE_SIGNAL_KEYWORDS', 'false').lower() == 'true'
+
+# Score leads whose domain has no DNS record as 0 without any SERP queries.
+# Off by default: a lead with a typo'd or parked domain may still have signals.
+SKIP_UNRESOLVED_DOMAINS = os.getenv('SKIP_UNRESOLVED_DOMAINS', 'false').lower() == 'true'
+
 # Validate required configuration
 def validate_config():
     """
@@ -83,9 +171,8 @@ def validate_config():
         raise ValueError("SERP_ZONE is required. Please set it in your .env file.")
 
     # Validate signal weights sum to 100 (optional check for consistency)
-    total_weight = sum(signal['weight'] for signal in CUSTOM_SIGNALS.values() if signal['enabled'])
-    if total_weight != 100:
-        print(f"Warning: Signal weights sum to {total_weight}, not 100. Adjust weights for accurate scoring.")
+    if ENABLED_WEIGHT_TOTAL != 100:
+        print(f"Warning: Signal weights sum to {ENABLED_WEIGHT_TOTAL}, not 100. Adjust weights for accurate scoring.")
 
 if __name__ == '__main__':
     # Quick config validation test
@@ -94,6 +181,6 @@ if __name__ == '__main__':
         print("✓ Configuration validated successfully")
         print(f"✓ SERP API configured for zone: {SERP_ZONE}")
         print(f"✓ Default search params: country={DEFAULT_COUNTRY}, language={DEFAULT_LANGUAGE}")
-        print(f"✓ Active signals: {len([s for s in CUSTOM_SIGNALS.values() if s['enabled']])}")
+        print(f"✓ Active signals: {sum(SIGNAL_ENABLED)}")
     except ValueError as e:
         print(f"✗ Configuration error: {e}")
@@ -0,0 +1,182 @@
+"""
+Result Cache for Lead Enrichment Engine
+Stores enrichment results on disk so repeated runs skip SERP lookups
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+import config
+
+
+class EnrichmentCache:
+    """
+    On-disk cache for enrichment results
+
+    Each entry is a small JSON file named after a hash of its key. Entries
+    expire after a TTL, and writes are atomic so concurrent workers never
+    read a partially written file.
+    """
+
+    def __init__(self, cache_dir=None, ttl=None):
+        """
+        Initialize cache
+
+        Args:
+            cache_dir (str, optional): Directory for cache files.
+                                       Defaults to config.CACHE_DIR.
+            ttl (int, optional): Seconds before an entry expires.
+                                 Defaults to config.CACHE_TTL.
+        """
+        self.cache_dir = cache_dir or config.CACHE_DIR
+        self.ttl = config.CACHE_TTL if ttl is None else ttl
+        self._last_prune = 0.0
+
+    def make_key(self, *parts):
+        """
+        Build a cache key from any number of parts
+
+        Example:
+            key = cache.make_key("acme.com", "Acme", "2026-01-20")
+        """
+        raw = '|'.join(str(part) for part in parts)
+        return hashlib.blake2b(raw.encode('utf-8'), digest_size=16).hexdigest()
+
+    def get(self, key):
+        """
+        Return the cached value for key, or None if missing or expired
+
+        Expired and malformed entries (e.g. a file truncated or edited by
+        hand) are deleted so the next set() starts clean.
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'r') as f:
+                entry = json.load(f)
+        except OSError:
+            return None
+        except ValueError:
+            self._discard(path)
+            return None
+
+        try:
+            expired = time.time() - entry['stored_at'] > self.ttl
+            value = entry['value']
+        except (TypeError, KeyError):
+            self._discard(path)
+            return None
+
+        if expired:
+            self._discard(path)
+            return None
+
+        return value
+
+    def set(self, key, value):
+        """
+        Store value under key and return it
+
+        Keys usually include the enrichment date, so old entries are never
+        read again; expired files are pruned at most once per TTL.
+
+        Failures to write (e.g. read-only home directory) are ignored so
+        caching never breaks enrichment. A value that can't be serialized
+        to JSON is a caller bug, so its TypeError/ValueError is re-raised.
+        Either way no partially written temp file is left behind.
+        """
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_path, 'w') as f:
+                json.dump({'stored_at': time.time(), 'value': value}, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            self._discard(tmp_path)
+        except BaseException:
+            self._discard(tmp_path)
+            raise
+
+        if time.time() - self._last_prune > self.ttl:
+            self.prune()
+
+        return value
+
+    def prune(self):
+        """
+        Delete every expired entry
+
+        Expiry is judged from file modification times, which match the
+        stored_at stamp since entries are written in one os.replace().
+
+        Returns:
+            int: Number of entries deleted
+        """
+        self._last_prune = time.time()
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return 0
+
+        deleted = 0
+        for name in names:
+            if not name.endswith('.json'):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                if self._last_prune - os.path.getmtime(path) > self.ttl:
+                    os.remove(path)
+                    deleted += 1
+            except OSError:
+                pass
+
+        return deleted
+
+    def invalidate(self, prefix=''):
+        """
+        Delete every entry whose key starts with prefix
+
+        Keys are opaque to the cache, so grouping entries under a shared
+        prefix is up to the caller that builds them.
+
+        Args:
+            prefix (str, optional): Key prefix to match. Clears the whole
+                                    cache if empty.
+
+        Returns:
+            int: Number of entries deleted
+
+        Example:
+            group = cache.make_key("acme.com")
+            cache.set(f"{group}-{cache.make_key('2026-01-20')}", result)
+            cache.invalidate(group)
+        """
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return 0
+
+        deleted = 0
+        for name in names:
+            if name.startswith(prefix) and name.endswith('.json'):
+                try:
+                    os.remove(os.path.join(self.cache_dir, name))
+                    deleted += 1
+                except OSError:
+                    pass
+
+        return deleted
+
+    def _discard(self, path):
+        """Remove a stale entry or a temp file left by a failed write, if there is one"""
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _path(self, key):
+        """Return the file path for a cache key"""
+        return os.path.join(self.cache_dir, f"{key}.json")
@@ -3,10 +3,142 @@ Custom Enrichment Engine for Lead Generation
 Combines signal tracking with profile enrichment and conversation starters
 """
 
+import copy
+import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass
 from datetime import datetime
+from types import MappingProxyType
+from enrichment_cache import EnrichmentCache
 from signal_tracker import SignalTracker
 
 
+@dataclass
+class EnrichedProfile:
+    """
+    Enriched lead profile as a flat, slotted record
+
+    A lighter alternative to the nested profile dicts for large batches
+    (see enrich_batch(as_objects=True)). to_dict() returns the usual
+    nested shape for code that expects it.
+    """
+
+    __slots__ = (
+        'enrichment_date', 'cache_hit', 'domain', 'company_name', 'total_score',
+        'intent_level', 'detected_signals', 'recommendation', 'early_stopped',
+        'queries_saved', 'conversation_starters', 'standard_data'
+    )
+
+    enrichment_date: str
+    cache_hit: bool
+    domain: str
+    company_name: str
+    total_score: int
+    intent_level: str
+    detected_signals: dict
+    recommendation: str
+    early_stopped: bool
+    queries_saved: int
+    conversation_starters: list
+    standard_data: dict
+
+    def to_dict(self):
+        """Return the profile in the nested shape of enrich_with_custom_signals()"""
+        return {
+            'enrichment_date': self.enrichment_date,
+            'cache_hit': self.cache_hit,
+            'domain': self.domain,
+            'company_name': self.company_name,
+            'custom_signals': {
+                'total_score': self.total_score,
+                'intent_level': self.intent_level,
+                'recommendation': self.recommendation,
+                'early_stopped': self.early_stopped,
+                'queries_saved': self.queries_saved,
+                'detected_signals': self.detected_signals
+            },
+            'conversation_starters': self.conversation_starters,
+            'standard_data': self.standard_data
+        }
+
+
+def profiles_to_arrow(profiles):
+    """
+    Convert EnrichedProfile records into a pyarrow Table
+
+    Columns are filled directly from the records (one list per field), with
+    typed scores and flags. detected_signals becomes a struct column keyed
+    by signal name; standard_data, whose keys vary per lead, is stored as a
+    JSON string. Requires pyarrow.
+
+    Args:
+        profiles (iterable): EnrichedProfile instances
+
+    Returns:
+        pyarrow.Table: One row per profile
+
+    Example:
+        profiles = [p for _, _, p, err in engine.enrich_batch(leads, as_objects=True) if p]
+        table = profiles_to_arrow(profiles)
+    """
+    pa = _import_pyarrow()
+
+    columns = {field: [] for field in EnrichedProfile.__slots__}
+    for profile in profiles:
+        _append_profile_columns(columns, profile)
+
+    return _columns_to_table(pa, columns)
+
+
+def _import_pyarrow():
+    """Import pyarrow, which is only needed for Arrow/Parquet export"""
+    try:
+        import pyarrow
+    except ImportError:
+        raise RuntimeError("Arrow export requires pyarrow (pip install pyarrow)")
+    return pyarrow
+
+
+def _append_profile_columns(columns, profile):
+    """Append one EnrichedProfile's fields to per-field column lists"""
+    for field in EnrichedProfile.__slots__:
+        columns[field].append(getattr(profile, field))
+    columns['standard_data'][-1] = json.dumps(profile.standard_data)
+
+
+def _columns_to_table(pa, columns):
+    """Build a pyarrow Table from per-field column lists, fixing the numeric types"""
+    return pa.Table.from_pydict({
+        **columns,
+        'total_score': pa.array(columns['total_score'], type=pa.int32()),
+        'queries_saved': pa.array(columns['queries_saved'], type=pa.int32())
+    })
+
+
+# Conversation starters per signal, in priority order:
+# (signal_type, template, evidence field, default if the field is missing).
+# A None default marks a list field whose first item is used.
+_STARTER_TEMPLATES = (
+    ('hiring_signals',
+     "Saw you're hiring for roles involving {} - are you expanding your team?",
+     'matched_keywords', None),
+    ('tech_stack_signals',
+     "Noticed you're working with {} - how's that migration going?",
+     'matched_keywords', None),
+    ('pain_point_signals',
+     "Read some feedback about {} - is this still a challenge?",
+     'matched_keywords', None),
+    ('strategic_signals',
+     "Just saw your post about {} - how does this fit into your roadmap?",
+     'source', 'your recent update'),
+)
+
+# Shared read-only fallback for reports without a 'signals' section
+_NO_SIGNALS = MappingProxyType({})
+
+
 class CustomEnrichmentEngine:
     """
     Main enrichment engine that orchestrates lead enrichment
@@ -18,17 +150,59 @@ class CustomEnrichmentEngine:
     4. Combines custom signals with existing lead data
     """
 
-    def __init__(self, signal_tracker=None):
+    def __init__(self, signal_tracker=None, cache=None, cache_ttl=None, memo_size=0):
         """
         Initialize enrichment engine with signal tracker
 
         Args:
             signal_tracker (SignalTracker, optional): Signal tracking instance.
                                                      Creates new instance if not provided.
+            cache (EnrichmentCache, optional): Disk cache for signal tracking
+                                               results. Caching is off if not provided.
+            cache_ttl (int, optional): Seconds before cached results expire.
+                                       Creates a default cache if none was provided.
+            memo_size (int, optional): Number of recent profiles kept in memory so
+                                       re-enriching a lead in the same process is
+                                       a dict lookup. Off (0) by default.
         """
         self.tracker = signal_tracker or SignalTracker()
 
-    def enrich_with_custom_signals(self, domain, company_name=None, existing_data=None):
+        if cache is None and cache_ttl is not None:
+            cache = EnrichmentCache(ttl=cache_ttl)
+        self.cache = cache
+
+        # In-process LRU of profiles (without standard_data) by (domain, company_name)
+        self.memo_size = memo_size
+        self._memo = OrderedDict()
+        self._memo_config = None
+        self._memo_lock = threading.Lock()
+
+        # (signals_config, digest) of the config last used in a cache key
+        self._config_digest = (None, None)
+
+    def invalidate(self, domain):
+        """
+        Drop cached signal tracking results and memoized profiles for a domain
+
+        Relies on every disk cache key starting with make_key(domain) (see
+        _cache_key()).
+
+        Args:
+            domain (str): Company domain (e.g., "acme.com")
+
+        Returns:
+            int: Number of disk cache entries deleted
+        """
+        with self._memo_lock:
+            for key in [key for key in self._memo if key[0] == domain]:
+                del self._memo[key]
+
+        if self.cache is None:
+            return 0
+        return self.cache.invalidate(self.cache.make_key(domain))
+
+    def enrich_with_custom_signals(self, domain, company_name=None, existing_data=None,
+                                   refresh=False, enrichment_date=None):
         """
         Enrich lead profile with custom buying signals
 
@@ -42,10 +216,14 @@ class CustomEnrichmentEngine:
             domain (str): Company domain (e.g., "acme.com")
             company_name (str, optional): Company name. Derived from domain if not provided.
             existing_data (dict, optional): Existing lead data to preserve (e.g., from CRM)
+            refresh (bool, optional): Skip cached results and overwrite them
+            enrichment_date (str, optional): ISO timestamp to stamp the profile with.
+                                             Defaults to the current UTC time.
 
         Returns:
             dict: Enriched profile containing:
                 - enrichment_date (str): ISO timestamp of enrichment
+                - cache_hit (bool): True if signals came from the cache
                 - domain (str): Company domain
                 - company_name (str): Company name
                 - custom_signals (dict): Signal tracking results
@@ -53,6 +231,11 @@ class CustomEnrichmentEngine:
                   - intent_level (str): High/Medium/Low classification
                   - detected_signals (dict): Detailed signal data
                   - recommendation (str): Actionable next steps
+                  - early_stopped (bool): True if some signals were skipped
+                  - queries_saved (int): SERP queries skipped as duplicates
+                  - domain_unresolved (bool): Only present, and True, when the
+                    domain had no DNS record (see SKIP_UNRESOLVED_DOMAINS).
+                    These results are never written to the disk cache.
                 - conversation_starters (list): Personalized opening messages
                 - standard_data (dict): Original lead data passed in
 
@@ -65,31 +248,372 @@ class CustomEnrichmentEngine:
             )
         """
         # Get current timestamp for enrichment tracking
-        enrichment_date = datetime.utcnow().isoformat()
+        if enrichment_date is None:
+            enrichment_date = datetime.utcnow().isoformat()
+
+        # Reuse a profile enriched earlier in this process
+        if not refresh:
+            profile = self._memo_get(domain, company_name, existing_data, enrichment_date)
+            if profile is not None:
+                return profile
 
         # Run signal tracking to detect buying signals
+        signal_results, cache_hit = self._track(domain, company_name, refresh)
+
+        profile = self._build_profile(signal_results, enrichment_date, cache_hit, existing_data)
+        self._memo_put(domain, company_name, profile)
+        return profile
+
+    async def aenrich(self, domain, company_name=None, existing_data=None, refresh=False,
+                      enrichment_date=None):
+        """
+        Enrich lead profile with custom buying signals from async code
+
+        Same profile as enrich_with_custom_signals(), but all SERP queries
+        for the company are issued concurrently and the event loop is never
+        blocked, so many leads can be enriched together with asyncio.gather().
+
+        Args:
+            domain (str): Company domain (e.g., "acme.com")
+            company_name (str, optional): Company name. Derived from domain if not provided.
+            existing_data (dict, optional): Existing lead data to preserve (e.g., from CRM)
+            refresh (bool, optional): Skip cached results and overwrite them
+            enrichment_date (str, optional): ISO timestamp to stamp the profile with.
+                                             Defaults to the current UTC time.
+
+        Returns:
+            dict: Enriched profile (see enrich_with_custom_signals())
+
+        Example:
+            engine = CustomEnrichmentEngine()
+            profiles = await asyncio.gather(
+                engine.aenrich("acme.com", "Acme Corp"),
+                engine.aenrich("globex.com")
+            )
+        """
+        if enrichment_date is None:
+            enrichment_date = datetime.utcnow().isoformat()
+
+        key = self._cache_key(domain, company_name)
+        if key is not None and not refresh:
+            signal_results = self.cache.get(key)
+            if signal_results is not None:
+                return self._build_profile(signal_results, enrichment_date, True, existing_data)
+
+        signal_results = await self.tracker.atrack_signals(domain, company_name)
+        if key is not None and not signal_results.get('domain_unresolved'):
+            self.cache.set(key, signal_results)
+
+        return self._build_profile(signal_results, enrichment_date, False, existing_data)
+
+    def enrich_batch(self, leads, max_workers=32, refresh=False, as_objects=False):
+        """
+        Enrich many leads concurrently
+
+        Signal tracking is dominated by SERP API round-trips, so leads are
+        tracked across a thread pool and profiles are built as each one
+        completes. Leads are pulled from the iterable as workers free up,
+        so at most a few per worker are buffered at any time.
+
+        Args:
+            leads (iterable): (domain, company_name) pairs - company_name may be None
+            max_workers (int): Maximum number of leads tracked at the same time
+            refresh (bool, optional): Skip cached results and overwrite them
+            as_objects (bool, optional): Yield EnrichedProfile records instead of dicts.
+                                         These are not memoized.
+
+        Yields:
+            tuple: (index, domain, profile, error) in completion order -
+                   index is the lead's 0-based position in leads, so callers
+                   can restore input order; profile is None and error is the
+                   raised exception when tracking failed
+
+        Raises:
+            Exception: Whatever iterating leads raises (e.g. a malformed CSV
+                       row), after every lead read before it has been yielded
+
+        Example:
+            leads = [("acme.com", "Acme Corp"), ("globex.com", None)]
+            for index, domain, profile, error in engine.enrich_batch(leads):
+                if error is None:
+                    print(domain, profile['custom_signals']['total_score'])
+        """
+        max_pending = max_workers * 4
+        pending = {}
+
+        # One timestamp for the whole batch instead of one per lead
+        enrichment_date = datetime.utcnow().isoformat()
+
+        def finished(done):
+            for future in done:
+                index, domain, company_name = pending.pop(future)
+                try:
+                    signal_results, cache_hit = future.result()
+                except Exception as e:
+                    yield index, domain, None, e
+                else:
+                    # Starters are cheap dict lookups, so build them on the caller's thread
+                    profile = self._build_profile(
+                        signal_results, enrichment_date, cache_hit, as_object=as_objects
+                    )
+                    if not as_objects:
+                        self._memo_put(domain, company_name, profile)
+                    yield index, domain, profile, None
+
+        pool = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            try:
+                for index, (domain, company_name) in enumerate(leads):
+                    # Leads enriched earlier in this process are answered from memory
+                    if not (refresh or as_objects):
+                        profile = self._memo_get(domain, company_name, enrichment_date=enrichment_date)
+                        if profile is not None:
+                            yield index, domain, profile, None
+                            continue
+
+                    future = pool.submit(self._track, domain, company_name, refresh)
+                    pending[future] = (index, domain, company_name)
+
+                    # Wait for a slot before reading more of the input
+                    if len(pending) >= max_pending:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        yield from finished(done)
+
+            except Exception:
+                # Reading the input failed part way through: finish the leads
+                # already submitted, then raise, so callers keep their results
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    yield from finished(done)
+                raise
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                yield from finished(done)
+        finally:
+            # Don't start queued leads if the caller stops early
+            for future in pending:
+                future.cancel()
+            pool.shutdown(wait=True)
+
+    def enrich_batch_to_arrow(self, leads, path=None, max_workers=32, refresh=False):
+        """
+        Enrich many leads straight into a columnar pyarrow Table
+
+        Profiles from enrich_batch() are appended field by field into one
+        list per column, so no per-lead dicts are built and the result can
+        be handed to pandas, Polars or DuckDB without row-by-row
+        conversion. Leads that fail get a row with only domain and error
+        set. Requires pyarrow.
+
+        Args:
+            leads (iterable): (domain, company_name) pairs - company_name may be None
+            path (str, optional): Also write the table to this Parquet file (zstd)
+            max_workers (int): Maximum number of leads tracked at the same time
+            refresh (bool, optional): Skip cached results and overwrite them
+
+        Returns:
+            pyarrow.Table: One row per lead, in completion order, with the
+                           EnrichedProfile fields plus an 'error' column
+
+        Example:
+            table = engine.enrich_batch_to_arrow(leads, path="enriched.parquet")
+            df = table.to_pandas()
+        """
+        # Fail before spending any SERP requests if pyarrow is missing
+        pa = _import_pyarrow()
+
+        columns = {field: [] for field in EnrichedProfile.__slots__}
+        errors = []
+
+        completed = self.enrich_batch(
+            leads, max_workers=max_workers, refresh=refresh, as_objects=True
+        )
+        for _, domain, profile, error in completed:
+            if error is None:
+                _append_profile_columns(columns, profile)
+                errors.append(None)
+            else:
+                for column in columns.values():
+                    column.append(None)
+                columns['domain'][-1] = domain
+                errors.append(str(error))
+
+        columns['error'] = errors
+        table = _columns_to_table(pa, columns)
+
+        if path:
+            import pyarrow.parquet as pq
+            pq.write_table(table, path, compression='zstd')
+
+        return table
+
+    def _memo_get(self, domain, company_name, existing_data=None, enrichment_date=None):
+        """
+        Return a copy of a memoized profile, or None if there isn't one
+
+        The copy is deep, so callers may modify it freely. It is marked as
+        a cache hit, stamped with the caller's enrichment_date (the current
+        UTC time if not given) and carries the caller's existing_data.
+        Memoized profiles are dropped whenever the tracker's signal
+        configuration changes.
+        """
+        if not self.memo_size:
+            return None
+
+        key = (domain, company_name)
+        with self._memo_lock:
+            if self._memo_config is not self.tracker.signals_config:
+                self._memo.clear()
+                self._memo_config = self.tracker.signals_config
+
+            memoized = self._memo.get(key)
+            if memoized is None:
+                return None
+            self._memo.move_to_end(key)
+
+        profile = copy.deepcopy(memoized)
+        profile['enrichment_date'] = enrichment_date or datetime.utcnow().isoformat()
+        profile['cache_hit'] = True
+        profile['standard_data'] = existing_data if existing_data is not None else {}
+        return profile
+
+    def _memo_put(self, domain, company_name, profile):
+        """
+        Memoize a profile (without its standard_data), evicting the least recently used
+
+        A deep copy is stored, so later changes to the caller's profile
+        don't leak into memo hits.
+        """
+        if not self.memo_size:
+            return
+
+        memoized = copy.deepcopy(
+            {key: value for key, value in profile.items() if key != 'standard_data'}
+        )
+
+        with self._memo_lock:
+            if self._memo_config is not self.tracker.signals_config:
+                self._memo.clear()
+                self._memo_config = self.tracker.signals_config
+
+            self._memo[(domain, company_name)] = memoized
+            self._memo.move_to_end((domain, company_name))
+            while len(self._memo) > self.memo_size:
+                self._memo.popitem(last=False)
+
+    def _track(self, domain, company_name=None, refresh=False):
+        """
+        Track signals for a lead, going through the cache when enabled
+
+        Args:
+            domain (str): Company domain
+            company_name (str, optional): Company name
+            refresh (bool, optional): Skip cached results and overwrite them
+
+        Returns:
+            tuple: (signal_results, cache_hit)
+        """
+        key = self._cache_key(domain, company_name)
+        if key is None:
+            return self.tracker.track_signals(domain, company_name), False
+
+        if not refresh:
+            signal_results = self.cache.get(key)
+            if signal_results is not None:
+                return signal_results, True
+
         signal_results = self.tracker.track_signals(domain, company_name)
 
+        # A domain skipped for having no DNS record may resolve soon, so its
+        # zero-score report is not kept for the cache's full TTL
+        if signal_results.get('domain_unresolved'):
+            return signal_results, False
+        return self.cache.set(key, signal_results), False
+
+    def _cache_key(self, domain, company_name):
+        """
+        Return the cache key for a lead, or None if caching is off
+
+        Keys have the form "<make_key(domain)>-<make_key(company_name,
+        config...)>". The domain hash prefix is a contract with invalidate(),
+        which passes it to EnrichmentCache.invalidate() to drop every entry
+        for the domain - keep it if the layout changes. The second part
+        covers the active signal configuration, so switching presets or
+        signals always triggers a fresh lookup.
+        """
+        if self.cache is None:
+            return None
+
+        # Serialize the signal configuration only when it changes, like the memo
+        signals_config = self.tracker.signals_config
+        digested_config, signals = self._config_digest
+        if digested_config is not signals_config:
+            # default=dict also serializes frozen (MappingProxyType) configs
+            signals = self.cache.make_key(json.dumps(signals_config, sort_keys=True, default=dict))
+            self._config_digest = (signals_config, signals)
+
+        early_stop = getattr(self.tracker, 'early_stop', False)
+        combine_keywords = getattr(self.tracker, 'combine_keywords', False)
+        check_dns = getattr(self.tracker, 'check_dns', False)
+        entry = self.cache.make_key(company_name, signals, early_stop, combine_keywords, check_dns)
+        return f"{self.cache.make_key(domain)}-{entry}"
+
+    def _build_profile(self, signal_results, enrichment_date, cache_hit=False, existing_data=None,
+                       as_object=False):
+        """
+        Combine signal tracking results into an enriched profile
+
+        Args:
+            signal_results (dict): Results from track_signals()
+            enrichment_date (str): ISO timestamp of enrichment
+            cache_hit (bool, optional): True if signal_results came from the cache
+            existing_data (dict, optional): Existing lead data to preserve
+            as_object (bool, optional): Return an EnrichedProfile instead of a dict
+
+        Returns:
+            dict: Enriched profile (see enrich_with_custom_signals()).
+                  signal_results is reused as its custom_signals section,
+                  so it must not be used afterwards.
+        """
         # Generate personalized conversation starters based on detected signals
         conversation_starters = self._generate_conversation_starters(signal_results)
+        standard_data = existing_data if existing_data is not None else {}
+
+        if as_object:
+            return EnrichedProfile(
+                enrichment_date=enrichment_date,
+                cache_hit=cache_hit,
+                domain=signal_results['domain'],
+                company_name=signal_results['company_name'],
+                total_score=signal_results['total_score'],
+                intent_level=signal_results['intent_level'],
+                detected_signals=signal_results['signals'],
+                recommendation=signal_results['recommendation'],
+                early_stopped=signal_results.get('early_stopped', False),
+                queries_saved=signal_results.get('queries_saved', 0),
+                conversation_starters=conversation_starters,
+                standard_data=standard_data
+            )
+
+        # Reuse the tracker's report as the custom_signals section rather than
+        # copying its fields into a new dict; the tracker's 'signals' key is
+        # exposed as 'detected_signals'
+        domain = signal_results.pop('domain')
+        company_name = signal_results.pop('company_name')
+        signal_results['detected_signals'] = signal_results.pop('signals')
 
         # Build enriched profile
-        enriched_profile = {
+        return {
             'enrichment_date': enrichment_date,
-            'domain': signal_results['domain'],
-            'company_name': signal_results['company_name'],
-            'custom_signals': {
-                'total_score': signal_results['total_score'],
-                'intent_level': signal_results['intent_level'],
-                'detected_signals': signal_results['signals'],
-                'recommendation': signal_results['recommendation']
-            },
+            'cache_hit': cache_hit,
+            'domain': domain,
+            'company_name': company_name,
+            'custom_signals': signal_results,
             'conversation_starters': conversation_starters,
-            'standard_data': existing_data or {}
+            'standard_data': standard_data
         }
 
-        return enriched_profile
-
     def _generate_conversation_starters(self, signal_results):
         """
         Generate personalized conversation starters based on detected signals
@@ -110,50 +634,28 @@ class CustomEnrichmentEngine:
             # ["Saw you're hiring for Data Engineer roles - are you expanding your team?"]
         """
         starters = []
-        signals = signal_results.get('signals', {})
-
-        # Generate starter based on hiring signals
-        if signals.get('hiring_signals', {}).get('detected'):
-            evidence = signals['hiring_signals'].get('evidence', [])
-            if evidence:
-                # Extract keywords from first piece of evidence
-                matched_keywords = evidence[0].get('matched_keywords', [])
-                if matched_keywords:
-                    keyword = matched_keywords[0]
-                    starters.append(
-                        f"Saw you're hiring for roles involving {keyword} - are you expanding your team?"
-                    )
+        signals = signal_results.get('signals') or _NO_SIGNALS
 
-        # Generate starter based on tech stack signals
-        if signals.get('tech_stack_signals', {}).get('detected'):
-            evidence = signals['tech_stack_signals'].get('evidence', [])
-            if evidence:
-                matched_keywords = evidence[0].get('matched_keywords', [])
-                if matched_keywords:
-                    keyword = matched_keywords[0]
-                    starters.append(
-                        f"Noticed you're working with {keyword} - how's that migration going?"
-                    )
+        # Walk the starter table in priority order, stopping at 3 starters
+        for signal_type, template, field, default in _STARTER_TEMPLATES:
+            signal = signals.get(signal_type)
+            if not (signal and signal.get('detected')):
+                continue
 
-        # Generate starter based on pain point signals
-        if signals.get('pain_point_signals', {}).get('detected'):
-            evidence = signals['pain_point_signals'].get('evidence', [])
-            if evidence:
-                matched_keywords = evidence[0].get('matched_keywords', [])
-                if matched_keywords:
-                    keyword = matched_keywords[0]
-                    starters.append(
-                        f"Read some feedback about {keyword} - is this still a challenge?"
-                    )
+            evidence = signal.get('evidence')
+            if not evidence:
+                continue
+
+            # Pull the first matched keyword (or the source) from the first piece of evidence
+            value = evidence[0].get(field, default)
+            if default is None:
+                if not value:
+                    continue
+                value = value[0]
 
-        # Generate starter based on strategic signals
-        if signals.get('strategic_signals', {}).get('detected'):
-            evidence = signals['strategic_signals'].get('evidence', [])
-            if evidence:
-                source = evidence[0].get('source', 'your recent update')
-                starters.append(
-                    f"Just saw your post about {source} - how does this fit into your roadmap?"
-                )
+            starters.append(template.format(value))
+            if len(starters) == 3:
+                return starters
 
         # Handle case where no signals were detected
         if not starters:
@@ -165,8 +667,7 @@ class CustomEnrichmentEngine:
                 f"Noticed {company_name}'s growth - how are you handling data at scale?"
             ]
 
-        # Return up to 3 starters
-        return starters[:3]
+        return starters
 
 
 if __name__ == "__main__":
@@ -7,6 +7,8 @@ Signals focus on hiring surges, manual processes, and recruiting technology gaps
 Use Case: Selling ATS, HRIS, onboarding platforms, or recruiting automation tools
 """
 
+from config import freeze_signals
+
 # Custom buying signals for HR Tech industry
 CUSTOM_SIGNALS = {
     'rapid_growth': {
@@ -68,3 +70,6 @@ INTENT_THRESHOLDS = {
     'medium': 30,  # Score >= 30 and < 60: Medium intent, warm lead
     'low': 0       # Score < 30: Low intent, nurture or disqualify
 }
+
+# Freeze the signal definitions and drop disabled ones (see config.freeze_signals)
+CUSTOM_SIGNALS = freeze_signals(CUSTOM_SIGNALS)
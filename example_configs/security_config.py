@@ -7,6 +7,8 @@ Signals focus on breaches, compliance requirements, and security hiring.
 Use Case: Selling security tools, compliance platforms, penetration testing, or security services
 """
 
+from config import freeze_signals
+
 # Custom buying signals for Cybersecurity industry
 CUSTOM_SIGNALS = {
     'security_incidents': {
@@ -68,3 +70,6 @@ INTENT_THRESHOLDS = {
     'medium': 30,  # Score >= 30 and < 60: Medium intent, warm lead
     'low': 0       # Score < 30: Low intent, nurture or disqualify
 }
+
+# Freeze the signal definitions and drop disabled ones (see config.freeze_signals)
+CUSTOM_SIGNALS = freeze_signals(CUSTOM_SIGNALS)
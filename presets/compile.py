@@ -0,0 +1,58 @@
+"""
+Preset Compiler for Custom Lead Enrichment Engine
+
+Bundles every preset JSON file into a single _compiled.json so the loader
+can list and load all presets with one file read instead of one per preset.
+
+Usage:
+    python -m presets.compile
+
+Re-run after adding or editing a preset. While _compiled.json is up to
+date it is used instead of the individual preset files; once a preset
+file is added, removed or edited the loader ignores the stale bundle
+(with a warning) and reads the files until it is recompiled.
+"""
+
+import json
+import os
+
+from presets.load_preset import COMPILED_PRESETS, PresetLoader, _list_preset_names
+
+
+def compile_presets(presets_dir=None):
+    """
+    Write all presets in a directory to a single compiled file
+
+    Args:
+        presets_dir (str, optional): Path to presets directory.
+                                     Defaults to this package's directory.
+
+    Returns:
+        tuple: (output_path, preset_names)
+
+    Example:
+        path, names = compile_presets()
+    """
+    loader = PresetLoader(presets_dir)
+    presets_dir = str(loader.presets_dir)
+
+    # Read the individual files, never a previously compiled bundle
+    compiled = {}
+    for name in _list_preset_names(presets_dir, os.stat(presets_dir).st_mtime_ns):
+        with open(os.path.join(presets_dir, f"{name}.json"), 'r') as f:
+            compiled[name] = json.load(f)
+
+    output_path = os.path.join(presets_dir, COMPILED_PRESETS)
+    tmp_path = f"{output_path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(compiled, f, indent=2)
+    os.replace(tmp_path, output_path)
+
+    return output_path, list(compiled)
+
+
+if __name__ == '__main__':
+    path, names = compile_presets()
+    print(f"✓ Compiled {len(names)} presets to {path}")
+    if names:
+        print(f"  {', '.join(names)}")
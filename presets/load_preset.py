@@ -5,10 +5,79 @@ This module provides utilities to load and apply industry-specific signal preset
 Presets are stored as JSON files and can be dynamically loaded at runtime.
 """
 
+import copy
 import json
 import os
+import warnings
+from functools import lru_cache
 from pathlib import Path
 
+# All presets bundled into one file by `python -m presets.compile`
+COMPILED_PRESETS = '_compiled.json'
+
+
+@lru_cache(maxsize=64)
+def _read_preset_file(path, mtime_ns):
+    """
+    Parse a preset JSON file once per modification
+
+    The file's mtime is part of the cache key, so editing a preset is
+    picked up on the next load. Callers must not mutate the returned
+    dict - it is shared by every later lookup of the same file.
+    """
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=16)
+def _list_preset_names(presets_dir, mtime_ns):
+    """
+    List preset names in a directory once per change to the directory
+
+    Adding, removing or renaming a file updates the directory's mtime,
+    which invalidates the cached listing. Files starting with an
+    underscore (such as the compiled bundle) are not presets.
+    """
+    # scandir's entries carry the file type, so no per-file stat or Path objects
+    with os.scandir(presets_dir) as entries:
+        return tuple(sorted(
+            entry.name[:-len('.json')]
+            for entry in entries
+            if entry.name.endswith('.json')
+            and not entry.name.startswith('_')
+            and entry.is_file()
+        ))
+
+
+@lru_cache(maxsize=16)
+def _bundle_is_current(presets_dir, dir_mtime_ns, compiled_path, compiled_mtime_ns):
+    """
+    Check that a compiled bundle still matches the preset files beside it
+
+    The bundle is stale if a preset file was added or removed since it was
+    compiled (its names no longer match the bundle's) or if any preset
+    file was modified after it.
+
+    The scan runs once per (directory mtime, bundle mtime) pair, so later
+    loads cost two stats. Adding, removing or atomically replacing a
+    preset changes the directory's mtime and triggers a fresh scan; a
+    preset edited in place is only noticed by processes started after
+    the edit.
+    """
+    compiled = _read_preset_file(compiled_path, compiled_mtime_ns)
+
+    names = set()
+    with os.scandir(presets_dir) as entries:
+        for entry in entries:
+            if (not entry.name.endswith('.json') or entry.name.startswith('_')
+                    or not entry.is_file()):
+                continue
+            if entry.stat().st_mtime_ns > compiled_mtime_ns:
+                return False
+            names.add(entry.name[:-len('.json')])
+
+    return names == compiled.keys()
+
 
 class PresetLoader:
     """
@@ -17,6 +86,11 @@ class PresetLoader:
     Presets are JSON files containing pre-configured signals optimized
     for specific industries. This class handles loading, validation, and
     application of these presets.
+
+    If the directory contains a compiled bundle (see presets/compile.py),
+    presets are listed and loaded from it instead of the individual files,
+    as long as it is up to date with them. A stale bundle is ignored with
+    a warning until it is compiled again.
     """
 
     def __init__(self, presets_dir=None):
@@ -45,13 +119,20 @@ class PresetLoader:
             presets = loader.list_available_presets()
             # ['devtools', 'hrtech', 'security', ...]
         """
-        json_files = self.presets_dir.glob('*.json')
-        return sorted([f.stem for f in json_files])
+        compiled = self._compiled()
+        if compiled is not None:
+            return sorted(compiled)
+
+        presets_dir = str(self.presets_dir)
+        return list(_list_preset_names(presets_dir, os.stat(presets_dir).st_mtime_ns))
 
     def load_preset(self, preset_name):
         """
         Load a preset from JSON file
 
+        Each file is parsed once per process; callers get their own deep
+        copy, so modifying the result never affects later loads.
+
         Args:
             preset_name (str): Name of preset (e.g., 'devtools', 'hrtech')
 
@@ -66,23 +147,69 @@ class PresetLoader:
             loader = PresetLoader()
             preset = loader.load_preset('devtools')
         """
+        return copy.deepcopy(self._load_cached(preset_name))
+
+    def _load_cached(self, preset_name):
+        """
+        Return the shared, memoized preset dict for read-only use
+
+        Raises:
+            FileNotFoundError: If preset file doesn't exist
+        """
         # Add .json extension if not present
         if not preset_name.endswith('.json'):
             preset_name = f"{preset_name}.json"
 
-        preset_path = self.presets_dir / preset_name
+        compiled = self._compiled()
+        if compiled is not None:
+            preset = compiled.get(preset_name[:-len('.json')])
+            if preset is None:
+                raise FileNotFoundError(
+                    f"Preset '{preset_name}' not found. "
+                    f"Available presets: {', '.join(sorted(compiled))}"
+                )
+            return preset
+
+        preset_path = str(self.presets_dir / preset_name)
 
-        if not preset_path.exists():
+        try:
+            mtime_ns = os.stat(preset_path).st_mtime_ns
+        except FileNotFoundError:
             available = self.list_available_presets()
             raise FileNotFoundError(
                 f"Preset '{preset_name}' not found. "
                 f"Available presets: {', '.join(available)}"
-            )
+            ) from None
 
-        with open(preset_path, 'r') as f:
-            preset = json.load(f)
+        return _read_preset_file(preset_path, mtime_ns)
 
-        return preset
+    def _compiled(self):
+        """
+        Return the compiled {name: preset} bundle, or None to use the files
+
+        The bundle is parsed once and re-read only when the file changes.
+        None is returned if there is no bundle, or if preset files were
+        added, removed or edited since it was compiled (see
+        _bundle_is_current() for when that is checked).
+        """
+        compiled_path = str(self.presets_dir / COMPILED_PRESETS)
+
+        try:
+            mtime_ns = os.stat(compiled_path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+        presets_dir = str(self.presets_dir)
+        dir_mtime_ns = os.stat(presets_dir).st_mtime_ns
+        if not _bundle_is_current(presets_dir, dir_mtime_ns, compiled_path, mtime_ns):
+            warnings.warn(
+                f"{compiled_path} is out of date with the preset files and is "
+                "ignored; run `python -m presets.compile` to rebuild it",
+                stacklevel=2
+            )
+            return None
+
+        return _read_preset_file(compiled_path, mtime_ns)
 
     def get_preset_info(self, preset_name):
         """
@@ -99,13 +226,13 @@ class PresetLoader:
             info = loader.get_preset_info('devtools')
             print(info['industry'])  # "Developer Tools & API Platforms"
         """
-        preset = self.load_preset(preset_name)
+        preset = self._load_cached(preset_name)
 
         return {
             'industry': preset.get('industry', 'Unknown'),
             'description': preset.get('description', ''),
             'signal_count': len(preset.get('signals', {})),
-            'example_companies': preset.get('example_companies', []),
+            'example_companies': list(preset.get('example_companies', [])),
             'typical_use_case': preset.get('typical_use_case', '')
         }
 
@@ -137,8 +264,13 @@ class PresetLoader:
 
         preset = self.load_preset(preset_name)
 
-        # Update config with preset signals
-        config.CUSTOM_SIGNALS = preset['signals']
+        # Update config with preset signals, dropping disabled ones up front
+        # (toggling a signal later requires applying the preset again)
+        config.CUSTOM_SIGNALS = {
+            name: signal for name, signal in preset['signals'].items()
+            if signal.get('enabled', False)
+        }
+        config.refresh_signal_tables()
 
         print(f"✓ Applied preset: {preset['industry']}")
         print(f"  Signals loaded: {len(preset['signals'])}")
@@ -160,8 +292,8 @@ class PresetLoader:
             loader = PresetLoader()
             comparison = loader.compare_presets('devtools', 'security')
         """
-        preset1 = self.load_preset(preset_name1)
-        preset2 = self.load_preset(preset_name2)
+        preset1 = self._load_cached(preset_name1)
+        preset2 = self._load_cached(preset_name2)
 
         return {
             'preset1': {
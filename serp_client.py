@@ -3,17 +3,112 @@ SERP API Client for Lead Enrichment Engine
 Handles communication with Bright Data SERP API to retrieve search results
 """
 
+import asyncio
 import logging
-import requests
+import random
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from functools import lru_cache
 from urllib.parse import quote_plus
-from requests.exceptions import RequestException
 import config
 
+try:
+    import orjson
+except ImportError:  # Optional - falls back to requests' stdlib decoder
+    orjson = None
+
 # Configure logging for API interactions
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
+class TTLCache:
+    """
+    Thread-safe in-memory cache with per-entry expiry and LRU eviction
+
+    Entries older than ttl seconds are treated as missing. Once max_size
+    entries are stored, adding another evicts the least recently used.
+    Used for SERP responses here and for DNS lookups in signal_tracker.
+
+    Example:
+        cache = TTLCache(max_size=100, ttl=60)
+        cache.set("acme.com", results)
+        cache.get("acme.com")  # results, or None after 60 seconds
+    """
+
+    def __init__(self, max_size=512, ttl=1800):
+        self._entries = OrderedDict()
+        self._max_size = max_size
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key):
+        """Return the cached value for key, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                stored_at, value = entry
+                if time.monotonic() - stored_at < self._ttl:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return value
+                del self._entries[key]
+            self._misses += 1
+            return None
+
+    def set(self, key, value):
+        """Store value under key, evicting the least recently used entry if full"""
+        if self._max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self):
+        """Drop every entry; returns how many were dropped"""
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+            return count
+
+    def stats(self):
+        """Return size, capacity and hit/miss counters"""
+        with self._lock:
+            return {
+                'size': len(self._entries),
+                'max_size': self._max_size,
+                'ttl': self._ttl,
+                'hits': self._hits,
+                'misses': self._misses
+            }
+
+
+@lru_cache(maxsize=None)
+def _jittered_retry_class():
+    """
+    Return a urllib3 Retry subclass whose exponential backoff is randomly stretched
+
+    Concurrent workers rate-limited at the same moment would otherwise
+    all retry in lockstep and trip the limit again. A Retry-After header
+    on 429/503 responses still takes precedence over the backoff.
+    Built on first use so importing this module doesn't load urllib3.
+    """
+    from urllib3.util.retry import Retry
+
+    class _JitteredRetry(Retry):
+        def get_backoff_time(self):
+            backoff = super().get_backoff_time()
+            return backoff + random.uniform(0, backoff)
+
+    return _JitteredRetry
+
+
 class SerpClient:
     """
     Client for interacting with Bright Data SERP API
@@ -22,25 +117,97 @@ class SerpClient:
     It manages authentication, request formatting, and error handling.
     """
 
-    def __init__(self):
+    def __init__(self, disk_cache=None):
         """
         Initialize SERP API client with credentials from config
 
-        Validates that required configuration is present before creating client
+        Required configuration is validated, and the HTTP stack imported,
+        only when the first request is sent, so clients whose queries are
+        all answered from cache stay cheap to create.
+
+        Args:
+            disk_cache (EnrichmentCache, optional): On-disk cache that keeps
+                                                    successful responses across
+                                                    runs. Off by default.
         """
-        config.validate_config()
         self.api_key = config.SERP_API_KEY
         self.zone = config.SERP_ZONE
         self.base_url = "https://api.brightdata.com/request"
         self.default_country = config.DEFAULT_COUNTRY
         self.default_language = config.DEFAULT_LANGUAGE
 
+        # Caps in-flight requests when leads are enriched concurrently
+        self._request_slots = threading.BoundedSemaphore(config.MAX_CONCURRENT_SERP)
+
+        # HTTP session, created by the session property on first use
+        self._session = None
+        self._session_lock = threading.Lock()
+
+        # Identical queries (same keyword across signals or repeated leads)
+        # are answered from memory instead of hitting the API again
+        self._cache = TTLCache(config.SERP_CACHE_SIZE, config.SERP_CACHE_TTL)
+        self.disk_cache = disk_cache
+        self._disk_hits = 0
+
+        # Queries currently being fetched, so concurrent identical queries
+        # wait for the one request instead of each sending their own
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+
         logger.info(f"SerpClient initialized for zone: {self.zone}")
 
+    @property
+    def session(self):
+        """
+        Pooled requests.Session, created on first use
+
+        Consecutive queries reuse keep-alive connections instead of paying a
+        TCP+TLS handshake each time. Rate limits and transient 5xx errors
+        are retried with jittered exponential backoff, honoring Retry-After.
+
+        Raises:
+            ValueError: If SERP_API_KEY or SERP_ZONE is not configured
+        """
+        if self._session is not None:
+            return self._session
+
+        with self._session_lock:
+            if self._session is None:
+                config.validate_config()
+
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                retry = _jittered_retry_class()(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                    allowed_methods=frozenset(["POST"])
+                )
+                adapter = HTTPAdapter(
+                    pool_connections=config.MAX_CONCURRENT_SERP,
+                    pool_maxsize=config.MAX_CONCURRENT_SERP,
+                    max_retries=retry
+                )
+                session = requests.Session()
+                session.mount("https://", adapter)
+                session.headers.update({
+                    "Content-Type": "application/json",
+                    "Authorization": f"Bearer {self.api_key}"
+                })
+                self._session = session
+
+        return self._session
+
     def query(self, keyword, gl=None, hl=None):
         """
         Execute a search query through Bright Data SERP API
 
+        Successful responses are cached in memory for config.SERP_CACHE_TTL
+        seconds, and a query already in flight from another thread is
+        waited on rather than sent twice. Callers must not modify the
+        returned dict.
+
         Args:
             keyword (str): Search query/keyword to look up
             gl (str, optional): Country code for search localization (e.g., 'us', 'uk')
@@ -50,6 +217,10 @@ class SerpClient:
             dict: JSON response from SERP API containing search results
                   Returns {"results": []} on failure to maintain consistent interface
 
+        Raises:
+            ValueError: If SERP_API_KEY or SERP_ZONE is not configured. Callers
+                        waiting on the same in-flight query get it too.
+
         Example:
             results = client.query("data engineer hiring", gl="us", hl="en")
         """
@@ -57,16 +228,61 @@ class SerpClient:
         gl = gl or self.default_country
         hl = hl or self.default_language
 
+        cache_key = (keyword, gl, hl)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"Using cached results for: '{keyword}'")
+            return cached
+
+        # Join an identical request already in flight, or become its owner
+        with self._inflight_lock:
+            future = self._inflight.get(cache_key)
+            owner = future is None
+            if owner:
+                future = self._inflight[cache_key] = Future()
+
+        if not owner:
+            logger.info(f"Waiting for in-flight query: '{keyword}'")
+            return future.result()
+
+        try:
+            result = self._fetch(keyword, gl, hl)
+        except BaseException as exc:
+            # Waiters get the same outcome as the owner, e.g. a config error
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                del self._inflight[cache_key]
+
+    def _fetch(self, keyword, gl, hl):
+        """
+        Send one search request to the SERP API and cache a successful response
+
+        The disk cache, if any, is checked first and written after a
+        successful request.
+
+        Returns:
+            dict: JSON response, or {"results": []} on failure
+        """
+        disk_key = None
+        if self.disk_cache is not None:
+            disk_key = self.disk_cache.make_key(keyword, gl, hl)
+            result = self.disk_cache.get(disk_key)
+            if result is not None:
+                logger.info(f"Using disk-cached results for: '{keyword}'")
+                with self._inflight_lock:
+                    self._disk_hits += 1
+                self._cache.set((keyword, gl, hl), result)
+                return result
+
         # URL encode the search keyword to handle special characters
         encoded_keyword = quote_plus(keyword)
         search_url = f"https://www.google.com/search?q={encoded_keyword}&gl={gl}&hl={hl}"
 
-        # Prepare request headers with authentication
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.api_key}"
-        }
-
         # Build request payload for Bright Data API
         payload = {
             "zone": self.zone,
@@ -74,22 +290,26 @@ class SerpClient:
             "format": "json"
         }
 
+        # Outside the try below, so missing credentials raise instead of
+        # being logged as a failed request
+        session = self.session
+        from requests.exceptions import RequestException
+
         try:
             logger.info(f"Querying SERP API: '{keyword}' (gl={gl}, hl={hl})")
 
-            # Make POST request with 30 second timeout
-            response = requests.post(
-                self.base_url,
-                json=payload,
-                headers=headers,
-                timeout=30
-            )
+            # Make POST request with 30 second timeout (auth headers are on the session)
+            with self._request_slots:
+                response = session.post(self.base_url, json=payload, timeout=30)
 
             # Raise exception for bad status codes (4xx, 5xx)
             response.raise_for_status()
 
-            # Parse and return JSON response
-            result = response.json()
+            # Parse and return JSON response (orjson is several times faster when installed)
+            result = orjson.loads(response.content) if orjson is not None else response.json()
+            self._cache.set((keyword, gl, hl), result)
+            if disk_key is not None:
+                self.disk_cache.set(disk_key, result)
             logger.info(f"Successfully retrieved results for: '{keyword}'")
             return result
 
@@ -103,6 +323,82 @@ class SerpClient:
             logger.error(f"Unexpected error processing SERP response for '{keyword}': {str(e)}")
             return {"results": []}
 
+    def invalidate(self):
+        """
+        Drop all cached search responses, in memory and on disk
+
+        Returns:
+            int: Number of cached responses dropped
+        """
+        dropped = self._cache.invalidate()
+        if self.disk_cache is not None:
+            dropped += self.disk_cache.invalidate()
+        return dropped
+
+    def stats(self):
+        """
+        Report response cache usage
+
+        Returns:
+            dict: size, max_size, ttl, hits and misses of the in-memory cache,
+                  plus disk_hits (misses answered from the disk cache)
+
+        Example:
+            print(client.stats())  # {'size': 12, 'max_size': 512, 'ttl': 1800, 'hits': 30, ...}
+        """
+        stats = self._cache.stats()
+        stats['disk_hits'] = self._disk_hits
+        return stats
+
+    async def query_async(self, keyword, gl=None, hl=None):
+        """
+        Execute a search query without blocking the event loop
+
+        Runs query() on the event loop's default executor, so it shares the
+        client's concurrency limit and error handling.
+
+        Args:
+            keyword (str): Search query/keyword to look up
+            gl (str, optional): Country code for search localization
+            hl (str, optional): Language code for search results
+
+        Returns:
+            dict: JSON response from SERP API (see query())
+
+        Example:
+            results = await client.query_async("data engineer hiring")
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.query, keyword, gl, hl)
+
+    async def query_many(self, keywords, gl=None, hl=None):
+        """
+        Execute several search queries concurrently
+
+        Wall time is roughly that of the slowest query instead of the sum
+        of all of them. At most config.MAX_CONCURRENT_SERP requests are in
+        flight at once; the rest wait on the event loop rather than each
+        tying up an executor thread.
+
+        Args:
+            keywords (list): Search queries/keywords to look up
+            gl (str, optional): Country code for search localization
+            hl (str, optional): Language code for search results
+
+        Returns:
+            list: JSON responses (see query()), in the same order as keywords
+
+        Example:
+            responses = asyncio.run(client.query_many(["Acme hiring", "Acme uses dbt"]))
+        """
+        slots = asyncio.Semaphore(config.MAX_CONCURRENT_SERP)
+
+        async def limited_query(keyword):
+            async with slots:
+                return await self.query_async(keyword, gl, hl)
+
+        return await asyncio.gather(*(limited_query(keyword) for keyword in keywords))
+
     def search_for_signals(self, query, result_count=3):
         """
         Search for buying signals and return formatted results
@@ -121,6 +417,8 @@ class SerpClient:
                 - url (str): Page URL
                 - description (str): Full description text
                 - snippet (str): First 150 characters of description
+                - title_lower (str): Lowercase title, for keyword matching
+                - description_lower (str): Lowercase description, for keyword matching
 
         Example:
             signals = client.search_for_signals("Acme Corp data quality issues", result_count=5)
@@ -159,7 +457,10 @@ class SerpClient:
                     "title": title,
                     "url": url,
                     "description": description,
-                    "snippet": snippet
+                    "snippet": snippet,
+                    # Lowercased once, for kept results only, so keyword matching can skip it
+                    "title_lower": title.lower(),
+                    "description_lower": description.lower()
                 })
 
             # Stop once we've collected enough results
@@ -3,8 +3,192 @@ Signal Tracker for Lead Enrichment Engine
 Detects buying signals by analyzing search results for specific keywords
 """
 
-from serp_client import SerpClient
-from config import CUSTOM_SIGNALS, INTENT_THRESHOLDS
+import asyncio
+import logging
+import re
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from functools import lru_cache
+from string import Formatter
+from serp_client import SerpClient, TTLCache
+from config import (
+    CUSTOM_SIGNALS, INTENT_THRESHOLDS, EARLY_STOP_SIGNALS, COMBINE_SIGNAL_KEYWORDS,
+    SKIP_UNRESOLVED_DOMAINS, MAX_CONCURRENT_SERP
+)
+
+# Progress goes to the log rather than stdout, so batch runs can silence it
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=256)
+def _compile_keywords(keywords):
+    """
+    Compile a keyword set into a single multi-pattern matcher
+
+    Lets one regex scan of a text find every keyword instead of one
+    substring search per keyword. The pattern reports the longest keyword
+    starting at each position; `implied` maps that keyword to every
+    keyword it contains, so overlaps like 'data' inside 'data engineer'
+    are still found.
+
+    Args:
+        keywords (tuple): Keywords to match (case-insensitive)
+
+    Returns:
+        tuple: (pattern, implied) - compiled regex and lowercase keyword map
+    """
+    lowered = sorted({k.lower() for k in keywords}, key=len, reverse=True)
+    pattern = re.compile('(?=(' + '|'.join(map(re.escape, lowered)) + '))')
+    implied = {k: {other for other in lowered if other in k} for k in lowered}
+    return pattern, implied
+
+
+@lru_cache(maxsize=64)
+def _compile_signal_matcher(signal_keywords):
+    """
+    Compile the keywords of every signal into one multi-pattern matcher
+
+    Args:
+        signal_keywords (tuple): (signal_type, keywords, keywords_lower) triples.
+                                 keywords_lower may be None to lowercase here.
+
+    Returns:
+        tuple: (pattern, implied, entries) - the matcher from
+               _compile_keywords() plus (signal_type, keyword, lowered)
+               triples in config order
+    """
+    entries = tuple(
+        (signal_type, keyword, lowered)
+        for signal_type, keywords, keywords_lower in signal_keywords
+        for keyword, lowered in zip(
+            keywords, keywords_lower or [keyword.lower() for keyword in keywords]
+        )
+    )
+    pattern, implied = _compile_keywords(tuple(keyword for _, keyword, _ in entries))
+    return pattern, implied, entries
+
+
+@lru_cache(maxsize=256)
+def _compile_query_template(template):
+    """
+    Turn a signal's query_template into a factory of per-company query builders
+
+    Templates of the usual shape - literal text around one {company_name}
+    followed by one {keyword} - are parsed once. For each company the text
+    before {keyword} is then built once, and each keyword's query is a
+    plain concatenation, with no str.format() re-parsing the template for
+    every keyword of every lead. Any other template falls back to
+    str.format().
+
+    Args:
+        template (str): Query template, e.g. "{company_name} hiring {keyword}"
+
+    Returns:
+        callable: for_company(company_name, domain) -> build(keyword) -> query string
+    """
+    def format_template(company_name, domain):
+        def build(keyword):
+            return template.format(company_name=company_name, domain=domain, keyword=keyword)
+        return build
+
+    try:
+        parsed = list(Formatter().parse(template))
+    except ValueError:
+        return format_template  # Malformed templates raise when used, as before
+
+    # Split into the literal text around each replacement field
+    # (escaped braces come back as extra field-less pieces)
+    fields = []
+    literals = ['']
+    for literal, field, spec, conversion in parsed:
+        literals[-1] += literal
+        if field is not None:
+            fields.append((field, spec, conversion))
+            literals.append('')
+
+    if fields != [('company_name', '', None), ('keyword', '', None)]:
+        return format_template
+
+    prefix, middle, suffix = literals
+
+    def for_company(company_name, domain):
+        head = f"{prefix}{company_name}{middle}"
+
+        def build(keyword):
+            return head + keyword + suffix
+        return build
+
+    return for_company
+
+
+def _result_text_lower(result):
+    """
+    Return a search result's title and description as one lowercase text
+
+    Uses the title_lower/description_lower fields added by
+    SerpClient.search_for_signals() when present. The newline separator
+    keeps keywords from matching across fields.
+    """
+    title_lower = result.get('title_lower')
+    if title_lower is None:
+        return f"{result.get('title', '')}\n{result.get('description', '')}".lower()
+    return f"{title_lower}\n{result.get('description_lower', '')}"
+
+
+# Seconds to wait for a DNS lookup before assuming the domain resolves
+DNS_TIMEOUT = 1.0
+
+# Lookup results, remembered per domain. A domain without a record is
+# re-checked after a few minutes, since it may just have been registered.
+_resolved_domains = TTLCache(max_size=4096, ttl=86400)
+_unresolved_domains = TTLCache(max_size=4096, ttl=300)
+
+# getaddrinfo() can't be interrupted, so lookups run here and callers stop
+# waiting after DNS_TIMEOUT; no threads are started until the first lookup
+_dns_lookups = ThreadPoolExecutor(max_workers=8, thread_name_prefix='dns-lookup')
+
+
+def _lookup_domain(domain):
+    """
+    Return False if a domain has no DNS record, True otherwise
+
+    Only a definite lookup failure counts as unresolved; other network
+    errors return True so a flaky resolver never skips real leads.
+    """
+    try:
+        socket.getaddrinfo(domain, None)
+    except socket.gaierror as e:
+        return e.errno not in (socket.EAI_NONAME, getattr(socket, 'EAI_NODATA', socket.EAI_NONAME))
+    except (OSError, UnicodeError):
+        return True
+    return True
+
+
+def _domain_resolves(domain):
+    """
+    Return False if a domain has no DNS record, True otherwise
+
+    Waits at most DNS_TIMEOUT seconds for the system resolver; a lookup
+    that takes longer counts as resolving and isn't remembered.
+    """
+    if _resolved_domains.get(domain):
+        return True
+    if _unresolved_domains.get(domain):
+        return False
+
+    try:
+        resolves = _dns_lookups.submit(_lookup_domain, domain).result(timeout=DNS_TIMEOUT)
+    except FutureTimeoutError:
+        return True
+
+    (_resolved_domains if resolves else _unresolved_domains).set(domain, True)
+    return resolves
+
+
+def _normalize_query(query):
+    """Return the form of a SERP query used to spot duplicates (lowercase, single spaces)"""
+    return ' '.join(query.lower().split())
 
 
 class SignalTracker:
@@ -18,17 +202,95 @@ class SignalTracker:
     4. Determining overall intent level
     """
 
-    def __init__(self, serp_client=None):
+    def __init__(self, serp_client=None, early_stop=None, max_workers=None, combine_keywords=None,
+                 check_dns=None):
         """
         Initialize signal tracker with SERP client and configuration
 
         Args:
             serp_client (SerpClient, optional): SERP API client instance.
                                                Creates new instance if not provided.
+            early_stop (bool, optional): Skip remaining signals once the intent
+                                         level is decided. Defaults to
+                                         config.EARLY_STOP_SIGNALS.
+            max_workers (int, optional): Threads issuing SERP queries in track_signals(),
+                                         shared by every lead tracked at the same
+                                         time. Defaults to config.MAX_CONCURRENT_SERP.
+            combine_keywords (bool, optional): Search each signal with a single OR
+                                               query of all its keywords. Defaults to
+                                               config.COMBINE_SIGNAL_KEYWORDS.
+            check_dns (bool, optional): Score domains without a DNS record as 0
+                                        without querying SERP. Defaults to
+                                        config.SKIP_UNRESOLVED_DOMAINS.
         """
         self.serp = serp_client or SerpClient()
         self.signals_config = CUSTOM_SIGNALS
         self.thresholds = INTENT_THRESHOLDS
+        self.early_stop = EARLY_STOP_SIGNALS if early_stop is None else early_stop
+        self.max_workers = MAX_CONCURRENT_SERP if max_workers is None else max_workers
+
+        # Query pool, created on first use by _query_pool()
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self.combine_keywords = (
+            COMBINE_SIGNAL_KEYWORDS if combine_keywords is None else combine_keywords
+        )
+
+        self.check_dns = SKIP_UNRESOLVED_DOMAINS if check_dns is None else check_dns
+
+        # A combined query has to surface every keyword, so it fetches more results
+        self.result_count = 10 if self.combine_keywords else 3
+
+    @property
+    def signals_config(self):
+        """
+        Signal definitions used for tracking
+
+        Disabled signals are filtered out once, when a config is assigned,
+        rather than on every lead. Toggling 'enabled' in place has no
+        effect until the config is assigned again.
+        """
+        return self._signals_config
+
+    @signals_config.setter
+    def signals_config(self, signals_config):
+        self._signals_config = signals_config
+        self._enabled_signals = tuple(
+            (signal_type, signal_config)
+            for signal_type, signal_config in signals_config.items()
+            if signal_config.get('enabled', False)
+        )
+
+        # Keyword sets for _scan(), lowercased here once per config; frozen
+        # configs (see example_configs/) already supply lowercased keywords
+        self._signal_keywords = tuple(
+            (
+                signal_type,
+                tuple(signal_config['keywords']),
+                signal_config.get('keywords_lower')
+                or tuple(keyword.lower() for keyword in signal_config['keywords'])
+            )
+            for signal_type, signal_config in self._enabled_signals
+            if signal_config['keywords']
+        )
+
+    @property
+    def thresholds(self):
+        """
+        Minimum score for each intent level, e.g. {'high': 60, 'medium': 30, 'low': 0}
+
+        Converted once, when assigned, into (label, threshold) bands ordered
+        from the highest threshold down, which _calculate_intent() walks.
+        """
+        return self._thresholds
+
+    @thresholds.setter
+    def thresholds(self, thresholds):
+        self._thresholds = thresholds
+        self._intent_bands = tuple(sorted(
+            ((level.title(), threshold) for level, threshold in thresholds.items()),
+            key=lambda band: -band[1]
+        ))
 
     def track_signals(self, domain, company_name=None):
         """
@@ -40,6 +302,13 @@ class SignalTracker:
         - Calculates overall intent score
         - Returns comprehensive signal report
 
+        The company's SERP queries are issued concurrently on the tracker's
+        shared thread pool.
+        With early stopping enabled, they are instead issued one by one as
+        signals are evaluated, from highest to lowest weight, and the
+        remaining queries are skipped once no outcome of them could change
+        the intent level.
+
         Args:
             domain (str): Company domain (e.g., "acme.com")
             company_name (str, optional): Company name. Derived from domain if not provided.
@@ -52,31 +321,237 @@ class SignalTracker:
                 - intent_level (str): High/Medium/Low intent classification
                 - signals (dict): Detailed signal detection results
                 - recommendation (str): Actionable next steps
+                - early_stopped (bool): True if some signals were skipped
+                - queries_saved (int): Planned queries answered by an identical earlier query
+                - domain_unresolved (bool): Only present, and True, when check_dns
+                  skipped the company because its domain has no DNS record
 
         Example:
             tracker = SignalTracker()
             result = tracker.track_signals("acme.com", "Acme Corporation")
         """
-        # Derive company name from domain if not provided
-        if not company_name:
-            # Remove common TLDs and convert to title case
-            # e.g., "acme.com" -> "Acme", "bright-data.io" -> "Bright Data"
-            company_name = domain.replace('.com', '').replace('.io', '').replace('.net', '')
-            company_name = company_name.replace('-', ' ').replace('_', ' ').title()
+        company_name = self._resolve_company_name(domain, company_name)
+
+        if self.check_dns and not _domain_resolves(domain):
+            return self._unresolved_report(domain, company_name)
+
+        logger.info(f"Tracking custom signals: {company_name}")
+
+        queries = self._plan_queries(domain, company_name)
+
+        if not self.early_stop:
+            # Fetch every distinct SERP query up front, in parallel
+            unique = self._unique_queries(queries)
+            results = []
+            if unique:
+                results = list(self._query_pool().map(
+                    lambda query: self.serp.search_for_signals(query, result_count=self.result_count),
+                    unique.values()
+                ))
+            results_by_query = dict(zip(unique, results))
+
+            report = self._score_signals(
+                domain, company_name, queries,
+                lambda query: results_by_query[_normalize_query(query)]
+            )
+            report['queries_saved'] = len(queries) - len(unique)
+            return report
+
+        # Search results are fetched from the SERP API as each signal is scored,
+        # once per distinct query even if several keywords plan the same one
+        fetched = {}
+        planned = 0
+
+        def fetch(query):
+            nonlocal planned
+            planned += 1
+            key = _normalize_query(query)
+            if key not in fetched:
+                fetched[key] = self.serp.search_for_signals(query, result_count=self.result_count)
+            return fetched[key]
+
+        report = self._score_signals(domain, company_name, queries, fetch, early_stop=True)
+        report['queries_saved'] = planned - len(fetched)
+        return report
+
+    async def atrack_signals(self, domain, company_name=None):
+        """
+        Track all enabled signals for a company without blocking the event loop
 
-        print(f"\n→ Tracking custom signals: {company_name}")
+        Same report as track_signals(), but every SERP query for the company
+        is issued at once, so wall time is roughly the slowest query instead
+        of the sum of all of them. Queries run on the event loop's default
+        executor and still share the SerpClient's concurrency limit. Since
+        all queries are already in flight, early stopping does not apply.
 
-        # Initialize tracking variables
-        total_score = 0
-        detected_signals = {}
+        Args:
+            domain (str): Company domain (e.g., "acme.com")
+            company_name (str, optional): Company name. Derived from domain if not provided.
+
+        Returns:
+            dict: Signal tracking report (see track_signals())
+
+        Example:
+            tracker = SignalTracker()
+            result = asyncio.run(tracker.atrack_signals("acme.com", "Acme Corporation"))
+        """
+        company_name = self._resolve_company_name(domain, company_name)
+
+        loop = asyncio.get_running_loop()
+        if self.check_dns and not await loop.run_in_executor(None, _domain_resolves, domain):
+            return self._unresolved_report(domain, company_name)
+
+        logger.info(f"Tracking custom signals: {company_name}")
+
+        # Fire every distinct SERP query for this company concurrently
+        queries = self._plan_queries(domain, company_name)
+        unique = self._unique_queries(queries)
+
+        results = await asyncio.gather(*(
+            loop.run_in_executor(None, self.serp.search_for_signals, query, self.result_count)
+            for query in unique.values()
+        ))
+        results_by_query = dict(zip(unique, results))
+
+        def fetch(query):
+            return results_by_query[_normalize_query(query)]
+
+        report = self._score_signals(domain, company_name, queries, fetch)
+        report['queries_saved'] = len(queries) - len(unique)
+        return report
+
+    def _query_pool(self):
+        """
+        Return the thread pool that issues SERP queries, creating it on first use
+
+        One pool serves every track_signals() call, so leads tracked
+        concurrently (e.g. by enrich_batch()) share max_workers threads -
+        sized to match the SERP client's request limit - instead of each
+        starting and tearing down a pool of its own.
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix='serp-query'
+                )
+            return self._executor
+
+    def _resolve_company_name(self, domain, company_name):
+        """Return company_name, or derive one from the domain if not provided"""
+        if company_name:
+            return company_name
+
+        # Remove common TLDs and convert to title case
+        # e.g., "acme.com" -> "Acme", "bright-data.io" -> "Bright Data"
+        company_name = domain.replace('.com', '').replace('.io', '').replace('.net', '')
+        return company_name.replace('-', ' ').replace('_', ' ').title()
+
+    def _unresolved_report(self, domain, company_name):
+        """Return a zero-score report for a domain without DNS records, without querying SERP"""
+        logger.info(f"Skipping signal tracking: {domain} does not resolve")
+        report = self._score_signals(domain, company_name, [], lambda query: [])
+        report['queries_saved'] = 0
+        report['domain_unresolved'] = True
+        return report
+
+    def _plan_queries(self, domain, company_name):
+        """
+        Build the SERP query for every keyword of every enabled signal
+
+        Several keywords may plan the same query (e.g. a keyword listed
+        under two signals with the same template); callers issue each
+        distinct query once, see _normalize_query(). With combine_keywords,
+        every keyword of a signal plans the same OR query, e.g.
+        'Acme hiring "data engineer" OR "dbt"'.
+
+        Args:
+            domain (str): Company domain
+            company_name (str): Company name
+
+        Returns:
+            list: (signal_type, keyword, query) tuples in signal order
+        """
+        queries = []
 
         # Iterate through each signal type (hiring, pain_point, tech_stack, strategic)
-        for signal_type, signal_config in self.signals_config.items():
-            # Skip disabled signals
-            if not signal_config.get('enabled', False):
+        for signal_type, signal_config in self._enabled_signals:
+            build_query = _compile_query_template(signal_config['query_template'])(company_name, domain)
+
+            if self.combine_keywords:
+                combined = ' OR '.join(f'"{keyword}"' for keyword in signal_config['keywords'])
+                query = build_query(combined)
+                queries.extend((signal_type, keyword, query) for keyword in signal_config['keywords'])
                 continue
 
-            print(f"  • Checking {signal_type.replace('_', ' ')}...")
+            for keyword in signal_config['keywords']:
+                # Build search query using template
+                # e.g., "{company_name} hiring {keyword}" -> "Acme hiring data engineer"
+                query = build_query(keyword)
+                queries.append((signal_type, keyword, query))
+
+        return queries
+
+    def _unique_queries(self, queries):
+        """
+        Collect the distinct SERP queries of a query plan
+
+        Args:
+            queries (list): (signal_type, keyword, query) tuples from _plan_queries()
+
+        Returns:
+            dict: Normalized query -> first planned query with that form, in plan order
+        """
+        unique = {}
+        for _, _, query in queries:
+            unique.setdefault(_normalize_query(query), query)
+        return unique
+
+    def _score_signals(self, domain, company_name, queries, fetch, early_stop=False):
+        """
+        Turn SERP results into a signal tracking report
+
+        Args:
+            domain (str): Company domain
+            company_name (str): Company name
+            queries (list): (signal_type, keyword, query) tuples from _plan_queries()
+            fetch (callable): Returns the search results for a query
+            early_stop (bool, optional): Evaluate signals by descending weight and
+                                         stop once the intent level is decided
+
+        Returns:
+            dict: Signal tracking report (see track_signals())
+        """
+        # Initialize tracking variables
+        total_score = 0
+        detected_signals = {}
+        early_stopped = False
+
+        # Search results often repeat across a company's queries, so each
+        # distinct result is scanned once for every signal's keywords
+        scans = {}
+
+        # Group each signal's keywords by query; with combine_keywords a
+        # signal's keywords all share one query
+        queries_by_signal = {}
+        for signal_type, keyword, query in queries:
+            queries_by_signal.setdefault(signal_type, {}).setdefault(query, []).append(keyword)
+
+        # Heaviest signals first, so the intent level is settled in as few queries as possible
+        enabled = self._enabled_signals
+        if early_stop:
+            enabled = sorted(enabled, key=lambda item: -item[1]['weight'])
+        remaining = sum(signal_config['weight'] for _, signal_config in enabled)
+
+        for signal_type, signal_config in enabled:
+            # Stop once even detecting every remaining signal can't change the intent level
+            if early_stop and (
+                self._calculate_intent(total_score) == self._calculate_intent(total_score + remaining)
+            ):
+                early_stopped = True
+                break
+            remaining -= signal_config['weight']
+
+            logger.debug(f"Checking {signal_type.replace('_', ' ')} for {company_name}")
 
             # Track signal detection results for this signal type
             signal_results = {
@@ -85,48 +560,53 @@ class SignalTracker:
                 'evidence': []
             }
 
-            # Search for each keyword in this signal category
-            keywords = signal_config['keywords']
-            query_template = signal_config['query_template']
-
             # We'll check multiple keywords and aggregate evidence
             all_evidence = []
             signal_detected = False
 
-            for keyword in keywords:
-                # Build search query using template
-                # e.g., "{company_name} hiring {keyword}" -> "Acme hiring data engineer"
-                query = query_template.format(
-                    company_name=company_name,
-                    domain=domain,
-                    keyword=keyword
-                )
-
-                # Get search results from SERP API
-                results = self.serp.search_for_signals(query, result_count=3)
-
-                # Analyze if this keyword appears in results
-                detected, evidence = self._analyze_signal(results, [keyword])
-
-                if detected:
-                    signal_detected = True
-                    all_evidence.extend(evidence)
+            for query, keywords in queries_by_signal.get(signal_type, {}).items():
+                # Analyze which of the query's keywords appear in each result
+                for result in fetch(query):
+                    text = _result_text_lower(result)
+                    if text not in scans:
+                        scans[text] = self._scan(text, lowered=True)
+
+                    found = scans[text].get(signal_type, ())
+                    matched_keywords = [keyword for keyword in keywords if keyword in found]
+                    if matched_keywords:
+                        signal_detected = True
+                        all_evidence.append({
+                            'source': result.get('title', 'Unknown'),
+                            'url': result.get('url', ''),
+                            'matched_keywords': matched_keywords,
+                            'snippet': result.get('snippet', '')
+                        })
 
             # Update signal results if any keyword was detected
             if signal_detected:
                 signal_results['detected'] = True
                 signal_results['evidence'] = all_evidence
                 total_score += signal_config['weight']
-                print(f"    ✓ Signal detected (+{signal_config['weight']} points)")
+                logger.debug(f"{signal_type} detected for {company_name} (+{signal_config['weight']} points)")
 
             # Store results for this signal type
             detected_signals[signal_type] = signal_results
 
+        # Report signals in config order; skipped signals count as not detected
+        if early_stop:
+            detected_signals = {
+                signal_type: detected_signals.get(signal_type) or {
+                    'detected': False,
+                    'weight': signal_config['weight'],
+                    'evidence': []
+                }
+                for signal_type, signal_config in self._enabled_signals
+            }
+
         # Calculate overall intent level based on total score
         intent_level = self._calculate_intent(total_score)
 
-        # Print summary
-        print(f"\n  ✓ Total signal score: {total_score}/100 ({intent_level} intent)")
+        logger.info(f"Total signal score for {company_name}: {total_score}/100 ({intent_level} intent)")
 
         # Get actionable recommendation
         recommendation = self._get_recommendation(intent_level, detected_signals)
@@ -138,58 +618,44 @@ class SignalTracker:
             'total_score': total_score,
             'intent_level': intent_level,
             'signals': detected_signals,
-            'recommendation': recommendation
+            'recommendation': recommendation,
+            'early_stopped': early_stopped
         }
 
-    def _analyze_signal(self, results, keywords):
+    def _scan(self, text, lowered=False):
         """
-        Analyze search results to detect signal keywords
+        Find the keywords of every enabled signal in a text with one pass
 
-        Performs case-insensitive matching of keywords in both
-        titles and descriptions of search results.
+        Matching is case-insensitive and the text is lowercased once,
+        however many signals and keywords are configured.
 
         Args:
-            results (list): List of search result dicts from SERP API
-            keywords (list): Keywords to search for in results
+            text (str): Text to scan (e.g., a search result title and description)
+            lowered (bool, optional): text is already lowercase
 
         Returns:
-            tuple: (signal_detected: bool, evidence: list)
-                - signal_detected: True if any keyword found in results
-                - evidence: List of dicts with detection details
+            dict: Signal type -> list of matched keywords, in config order.
+                  Signals with no matches are omitted.
 
         Example:
-            detected, evidence = self._analyze_signal(results, ["data engineer", "ML"])
+            matches = self._scan("Acme is hiring a data engineer")
+            # {"hiring_signals": ["data engineer"]}
         """
-        evidence = []
-        signal_detected = False
-
-        # Handle empty results gracefully
-        if not results:
-            return False, []
-
-        # Check each search result
-        for result in results:
-            title = result.get('title', '').lower()
-            description = result.get('description', '').lower()
-
-            # Check if any keyword appears in title or description
-            matched_keywords = []
-            for keyword in keywords:
-                keyword_lower = keyword.lower()
-                if keyword_lower in title or keyword_lower in description:
-                    matched_keywords.append(keyword)
-                    signal_detected = True
-
-            # If keywords found, record evidence
-            if matched_keywords:
-                evidence.append({
-                    'source': result.get('title', 'Unknown'),
-                    'url': result.get('url', ''),
-                    'matched_keywords': matched_keywords,
-                    'snippet': result.get('snippet', '')
-                })
-
-        return signal_detected, evidence
+        if not self._signal_keywords:
+            return {}
+
+        pattern, implied, entries = _compile_signal_matcher(self._signal_keywords)
+
+        found = set()
+        for match in pattern.finditer(text if lowered else text.lower()):
+            found |= implied[match.group(1)]
+
+        matches = {}
+        for signal_type, keyword, keyword_lower in entries:
+            if keyword_lower in found:
+                matches.setdefault(signal_type, []).append(keyword)
+
+        return matches
 
     def _calculate_intent(self, score):
         """
@@ -207,12 +673,10 @@ class SignalTracker:
         Example:
             intent = self._calculate_intent(65)  # Returns "High"
         """
-        if score >= self.thresholds['high']:
-            return "High"
-        elif score >= self.thresholds['medium']:
-            return "Medium"
-        else:
-            return "Low"
+        for label, threshold in self._intent_bands:
+            if score >= threshold:
+                return label
+        return "Low"
 
     def _get_recommendation(self, intent_level, signals):
         """
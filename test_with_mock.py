@@ -8,48 +8,62 @@ from signal_tracker import SignalTracker
 from serp_client import SerpClient
 
 
+# Mock SERP response, built once and shared by every query
+_MOCK_PAYLOAD = {
+    "results": [
+        {
+            "title": "Snowflake is hiring Data Engineers",
+            "url": "https://careers.snowflake.com/jobs/data-engineer",
+            "description": "Join our growing team as a Data Engineer. We're looking for talented individuals with experience in Snowflake, dbt, and modern data stack technologies. This is an exciting opportunity to work on cutting-edge data infrastructure."
+        },
+        {
+            "title": "Customer Review: Data Quality Issues at Scale",
+            "url": "https://g2.com/products/snowflake/reviews",
+            "description": "While Snowflake is powerful, we've experienced some data quality issues when scaling to large datasets. Manual data processes are still required for certain workflows, which slows down our reporting capabilities."
+        },
+        {
+            "title": "Snowflake Blog: Our Data Strategy for 2026",
+            "url": "https://snowflake.com/blog/data-strategy-2026",
+            "description": "We're investing heavily in analytics transformation and modern data stack technologies. Our goal is to become the leading cloud data platform by focusing on data strategy and customer success."
+        }
+    ]
+}
+
+# Every mock description already passes search_for_signals()'s 60-600 char
+# length filter, so it is checked once here instead of per formatted result
+# (explicitly, so the check still runs under python -O)
+for _result in _MOCK_PAYLOAD['results']:
+    if not 60 <= len(_result['description']) <= 600:
+        raise ValueError(
+            f"Mock description for {_result['url']} is outside the 60-600 "
+            f"character range search_for_signals() keeps"
+        )
+del _result
+
+# The payload formatted the way SerpClient.search_for_signals() would
+_MOCK_FORMATTED = [
+    {
+        'title': result['title'],
+        'url': result['url'],
+        'description': result['description'],
+        'snippet': result['description'][:150] + "..." if len(result['description']) > 150 else result['description'],
+        'title_lower': result['title'].lower(),
+        'description_lower': result['description'].lower()
+    }
+    for result in _MOCK_PAYLOAD['results']
+]
+
+
 class MockSerpClient:
     """Mock SERP client that returns test data"""
 
     def query(self, keyword, gl='us', hl='en'):
-        """Return mock search results"""
-        return {
-            "results": [
-                {
-                    "title": "Snowflake is hiring Data Engineers",
-                    "url": "https://careers.snowflake.com/jobs/data-engineer",
-                    "description": "Join our growing team as a Data Engineer. We're looking for talented individuals with experience in Snowflake, dbt, and modern data stack technologies. This is an exciting opportunity to work on cutting-edge data infrastructure."
-                },
-                {
-                    "title": "Customer Review: Data Quality Issues at Scale",
-                    "url": "https://g2.com/products/snowflake/reviews",
-                    "description": "While Snowflake is powerful, we've experienced some data quality issues when scaling to large datasets. Manual data processes are still required for certain workflows, which slows down our reporting capabilities."
-                },
-                {
-                    "title": "Snowflake Blog: Our Data Strategy for 2026",
-                    "url": "https://snowflake.com/blog/data-strategy-2026",
-                    "description": "We're investing heavily in analytics transformation and modern data stack technologies. Our goal is to become the leading cloud data platform by focusing on data strategy and customer success."
-                }
-            ]
-        }
+        """Return mock search results (shared - do not modify)"""
+        return _MOCK_PAYLOAD
 
     def search_for_signals(self, query, result_count=3):
         """Return formatted mock results"""
-        data = self.query(query)
-        results = []
-
-        for result in data.get('results', [])[:result_count]:
-            description = result.get('description', '')
-
-            if 60 <= len(description) <= 600:
-                results.append({
-                    'title': result.get('title', ''),
-                    'url': result.get('url', ''),
-                    'description': description,
-                    'snippet': description[:150] + "..." if len(description) > 150 else description
-                })
-
-        return results
+        return _MOCK_FORMATTED[:result_count]
 
 
 def test_enrichment():